@@ -15,6 +15,8 @@
 # You should have received a copy of the GNU General Public License
 # along with this program.  If not, see <https://www.gnu.org/licenses/>.
 
+# pylint: disable=too-many-lines
+
 from __future__ import annotations
 
 import collections.abc
@@ -24,6 +26,7 @@ import enum
 import fcntl
 import logging
 import math
+import time
 import typing
 import warnings
 
@@ -88,13 +91,15 @@ class _ReceivedPacket:  # unstable
     # "Table 31: Typical RSSI_offset Values"
     _RSSI_OFFSET_dB = 74
 
-    def __init__(
+    def __init__(  # pylint: disable=too-many-arguments
         self,
         *,
         payload: bytes,
         rssi_index: int,  # byte
         checksum_valid: bool,
         link_quality_indicator: int,  # 7bit
+        monotonic_time_ns: int | None = None,
+        realtime_ns: int | None = None,
     ):
         self.payload = payload
         self._rssi_index = rssi_index
@@ -102,6 +107,11 @@ class _ReceivedPacket:  # unstable
         self.checksum_valid = checksum_valid
         self.link_quality_indicator = link_quality_indicator
         assert 0 <= link_quality_indicator < (1 << 7), link_quality_indicator
+        # kernel timestamp of GDO0's rising edge (end of packet),
+        # comparable with time.monotonic_ns()
+        self.monotonic_time_ns = monotonic_time_ns
+        # estimate of the edge's CLOCK_REALTIME, comparable with time.time_ns()
+        self.realtime_ns = realtime_ns
 
     @property
     def rssi_dbm(self) -> float:
@@ -114,6 +124,20 @@ class _ReceivedPacket:  # unstable
             return (self._rssi_index - 256) / 2 - self._RSSI_OFFSET_dB
         return self._rssi_index / 2 - self._RSSI_OFFSET_dB
 
+    @property
+    def timestamp(self) -> datetime.datetime | None:
+        """
+        Time of reception (end of packet) as timezone-aware datetime,
+        None if unknown.
+
+        See .realtime_ns and .monotonic_time_ns for nanosecond resolution.
+        """
+        if self.realtime_ns is None:
+            return None
+        return datetime.datetime.fromtimestamp(
+            self.realtime_ns / 10**9, tz=datetime.timezone.utc
+        )
+
     def __str__(self) -> str:
         return f"{type(self).__name__}(RSSI {self.rssi_dbm:.0f}dBm, 0x{self.payload.hex()})"
 
@@ -935,6 +959,22 @@ class CC1101:
         _LOGGER.info("transmitting 0x%s (%r)", payload.hex(), payload)
         self._command_strobe(StrobeAddress.STX)
 
+    def _transmission_completed(self) -> bool:
+        """
+        True, if the transmission started by .transmit() is completed,
+        i.e. the device returned to IDLE state and the TX FIFO is empty.
+        """
+        marcstate = self.get_main_radio_control_state_machine_state()
+        if marcstate == MainRadioControlStateMachineState.TXFIFO_UNDERFLOW:
+            self._flush_tx_fifo_buffer()
+            raise RuntimeError("TX FIFO underflow")
+        return (
+            marcstate == MainRadioControlStateMachineState.IDLE
+            # > TXBYTES [6:0] NUM_TXBYTES
+            and not self._read_status_register(StatusRegisterAddress.TXBYTES)
+            & 0b01111111
+        )
+
     @contextlib.contextmanager
     def asynchronous_transmission(self) -> collections.abc.Iterator[Pin]:
         """
@@ -962,7 +1002,9 @@ class CC1101:
     def _enable_receive_mode(self) -> None:
         self._command_strobe(StrobeAddress.SRX)
 
-    def _get_received_packet(self) -> _ReceivedPacket | None:  # unstable
+    def _get_received_packet(  # unstable
+        self, *, monotonic_time_ns: int | None = None, realtime_ns: int | None = None
+    ) -> _ReceivedPacket | None:
         """
         see section "20 Data FIFO"
         """
@@ -976,6 +1018,8 @@ class CC1101:
             rssi_index=buffer[-2],
             checksum_valid=bool(buffer[-1] >> 7),
             link_quality_indicator=buffer[-1] & 0b0111111,
+            monotonic_time_ns=monotonic_time_ns,
+            realtime_ns=realtime_ns,
         )
 
     def _wait_for_packet(  # unstable
@@ -985,15 +1029,24 @@ class CC1101:
     ) -> _ReceivedPacket | None:
         """
         depends on IOCFG0 == 0b00000001 (see _configure_defaults)
+
+        The returned packet carries the kernel's timestamp of GDO0's rising edge
+        (see _ReceivedPacket.monotonic_time_ns), unaffected by SPI read latency.
         """
         # pylint: disable=protected-access
         gdo0 = cc1101._gpio.GPIOLine.find(name=gdo0_gpio_line_name)
         self._enable_receive_mode()
-        if not gdo0.wait_for_rising_edge(consumer=b"CC1101:GDO0", timeout=timeout):
+        monotonic_time_ns = gdo0.wait_for_rising_edge(
+            consumer=b"CC1101:GDO0", timeout=timeout
+        )
+        if monotonic_time_ns is None:
             self._command_strobe(StrobeAddress.SIDLE)
             _LOGGER.debug(
                 "reached timeout of %.02f seconds while waiting for packet",
                 timeout.total_seconds(),
             )
             return None  # timeout
-        return self._get_received_packet()
+        return self._get_received_packet(
+            monotonic_time_ns=monotonic_time_ns,
+            realtime_ns=monotonic_time_ns + time.time_ns() - time.monotonic_ns(),
+        )
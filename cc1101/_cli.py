@@ -17,13 +17,17 @@
 
 import argparse
 import logging
+import signal
 import sys
 
 import cc1101
+import cc1101._daemon
 import cc1101.options
 
 _LOGGER = logging.getLogger(__name__)
 
+# pylint: disable=protected-access; internal daemon module
+
 
 def _add_common_args(argparser: argparse.ArgumentParser) -> None:
     argparser.add_argument("-f", "--base-frequency-hertz", type=int)
@@ -64,6 +68,19 @@ def _add_common_args(argparser: argparse.ArgumentParser) -> None:
     argparser.add_argument("-d", "--debug", action="store_true")
 
 
+def _add_daemon_client_arg(argparser: argparse.ArgumentParser) -> None:
+    argparser.add_argument(
+        "--daemon",
+        metavar="SOCKET_PATH",
+        dest="daemon_socket_path",
+        nargs="?",
+        const=cc1101._daemon.DEFAULT_SOCKET_PATH,
+        help="Send request to cc1101-daemon instead of accessing the device directly"
+        f" (default socket path: {cc1101._daemon.DEFAULT_SOCKET_PATH})."
+        " Settings are kept by the daemon for subsequent requests.",
+    )
+
+
 def _init_logging(args: argparse.Namespace) -> None:
     logging.basicConfig(
         level=logging.DEBUG if args.debug else logging.INFO,
@@ -78,7 +95,7 @@ def _init_logging(args: argparse.Namespace) -> None:
 
 def _configure_via_args(
     *,
-    transceiver: cc1101.CC1101,
+    transceiver: cc1101.CC1101 | cc1101._daemon._RemoteSettings,
     args: argparse.Namespace,
     packet_length_if_fixed: int | None,
 ) -> None:
@@ -108,6 +125,22 @@ def _configure_via_args(
         transceiver.set_output_power(args.output_power_settings)
 
 
+def _print_config(
+    register_values: dict[cc1101.addresses.ConfigurationRegisterAddress, int],
+    patable: tuple[int, ...],
+) -> None:
+    print("[")
+    for register_index, (register, value) in enumerate(register_values.items()):
+        assert register_index == register.value
+        print(
+            "0b{value:08b}, # 0x{value:02x} {register_name}".format(
+                value=value, register_name=register.name
+            )
+        )
+    print("]")
+    print("# PATABLE = " + cc1101._format_patable(patable, insert_spaces=True))
+
+
 def _export_config():
     argparser = argparse.ArgumentParser(
         description="Export values in CC1101's configuration registers"
@@ -116,29 +149,27 @@ def _export_config():
     )
     _add_common_args(argparser)
     argparser.add_argument("--format", choices=["python-list"], default="python-list")
+    _add_daemon_client_arg(argparser)
     args = argparser.parse_args()
     _init_logging(args)
     _LOGGER.debug("args=%r", args)
+    if args.daemon_socket_path:
+        settings = cc1101._daemon._RemoteSettings()
+        _configure_via_args(
+            transceiver=settings, args=args, packet_length_if_fixed=None
+        )
+        with cc1101._daemon._DaemonClient(args.daemon_socket_path) as client:
+            client.configure(settings)
+            _print_config(*client.export_config())
+        return
     with cc1101.CC1101(lock_spi_device=True) as transceiver:
         _configure_via_args(
             transceiver=transceiver, args=args, packet_length_if_fixed=None
         )
         _LOGGER.info("%s", transceiver)
-        print("[")
-        for register_index, (register, value) in enumerate(
-            transceiver.get_configuration_register_values().items()
-        ):
-            assert register_index == register.value
-            print(
-                "0b{value:08b}, # 0x{value:02x} {register_name}".format(
-                    value=value, register_name=register.name
-                )
-            )
-        print("]")
-        print(
-            # pylint: disable=protected-access; internal function & method
-            "# PATABLE = "
-            + cc1101._format_patable(transceiver._get_patable(), insert_spaces=True)
+        _print_config(
+            transceiver.get_configuration_register_values(),
+            transceiver._get_patable(),
         )
 
 
@@ -149,10 +180,20 @@ def _transmit():
         allow_abbrev=False,
     )
     _add_common_args(argparser)
+    _add_daemon_client_arg(argparser)
     args = argparser.parse_args()
     _init_logging(args)
     _LOGGER.debug("args=%r", args)
     payload = sys.stdin.buffer.read()
+    if args.daemon_socket_path:
+        settings = cc1101._daemon._RemoteSettings()
+        _configure_via_args(
+            transceiver=settings, args=args, packet_length_if_fixed=len(payload)
+        )
+        with cc1101._daemon._DaemonClient(args.daemon_socket_path) as client:
+            client.configure(settings)
+            client.transmit(payload)
+        return
     # configure transceiver after reading from stdin
     # to avoid delay between configuration and transmission if pipe is slow
     with cc1101.CC1101(lock_spi_device=True) as transceiver:
@@ -161,3 +202,38 @@ def _transmit():
         )
         _LOGGER.info("%s", transceiver)
         transceiver.transmit(payload)
+
+
+def _daemon():
+    argparser = argparse.ArgumentParser(
+        description="Keeps the transceiver configured and serves requests"
+        " of local clients (e.g., cc1101-transmit --daemon) via a unix domain socket.",
+        allow_abbrev=False,
+    )
+    _add_common_args(argparser)
+    argparser.add_argument("--socket-path", default=cc1101._daemon.DEFAULT_SOCKET_PATH)
+    argparser.add_argument(
+        "--gdo0-gpio-line-name",
+        default="GPIO24",
+        help="Name of GPIO pin connected to GDO0 pin, for receiving packets"
+        " (default: %(default)s)",
+    )
+    args = argparser.parse_args()
+    _init_logging(args)
+    _LOGGER.debug("args=%r", args)
+    with cc1101.CC1101(lock_spi_device=True) as transceiver:
+        _configure_via_args(
+            transceiver=transceiver, args=args, packet_length_if_fixed=None
+        )
+        _LOGGER.info("%s", transceiver)
+        daemon = cc1101._daemon._Daemon(
+            transceiver,
+            socket_path=args.socket_path,
+            gdo0_gpio_line_name=args.gdo0_gpio_line_name.encode(),
+        )
+        # cleanup via KeyboardInterrupt
+        signal.signal(signal.SIGTERM, signal.default_int_handler)
+        try:
+            daemon.serve_forever()
+        except KeyboardInterrupt:
+            _LOGGER.info("stopping")
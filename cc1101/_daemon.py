@@ -0,0 +1,398 @@
+# python-cc1101 - Python Library to Transmit RF Signals via CC1101 Transceivers
+#
+# Copyright (C) 2026 Fabian Peter Hammerle <fabian@hammerle.me>
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+from __future__ import annotations
+
+import collections.abc
+import datetime
+import enum
+import logging
+import os
+import selectors
+import socket
+import struct
+import time
+import typing
+
+import cc1101
+import cc1101._gpio
+from cc1101.addresses import ConfigurationRegisterAddress, StrobeAddress
+from cc1101.options import PacketLengthMode, SyncMode
+
+_LOGGER = logging.getLogger(__name__)
+
+# pylint: disable=protected-access; unstable receive api of CC1101
+
+DEFAULT_SOCKET_PATH = "/run/cc1101.sock"
+
+# every message consists of a header (opcode, length of body) and a body
+_HEADER = struct.Struct(">BH")
+# body of _Opcode.PACKET: realtime_ns (-1 if unknown), RSSI, LQI | CRC_OK << 7,
+# followed by the payload
+_PACKET_HEADER = struct.Struct(">qBB")
+_CLIENT_TIMEOUT_SECONDS = 1
+
+
+class _Opcode(enum.IntEnum):
+    # requests
+    TRANSMIT = 0x01  # body: payload
+    CONFIGURE = 0x02  # body: sequence of (_Setting, length byte, value)
+    EXPORT_CONFIG = 0x03  # response body: configuration registers & PATABLE
+    SUBSCRIBE = 0x04  # followed by PACKET messages
+    # responses
+    OK = 0x80
+    ERROR = 0x81  # body: utf-8 encoded error message
+    PACKET = 0x82
+
+
+class _Setting(enum.IntEnum):
+    BASE_FREQUENCY_HERTZ = 0x01  # uint32
+    SYMBOL_RATE_BAUD = 0x02  # uint32
+    SYNC_MODE = 0x03  # SyncMode
+    PACKET_LENGTH_MODE = 0x04  # PacketLengthMode
+    PACKET_LENGTH_BYTES = 0x05  # uint8
+    DISABLE_CHECKSUM = 0x06  # empty
+    OUTPUT_POWER = 0x07  # PATABLE settings
+
+
+def _recv_exactly(sock: socket.socket, length: int) -> bytes:
+    data = b""
+    while len(data) < length:
+        chunk = sock.recv(length - len(data))
+        if not chunk:
+            raise ConnectionError("connection closed by peer")
+        data += chunk
+    return data
+
+
+def _send_message(sock: socket.socket, opcode: _Opcode, body: bytes = b"") -> None:
+    sock.sendall(_HEADER.pack(opcode, len(body)) + body)
+
+
+def _recv_message(sock: socket.socket) -> tuple[_Opcode, bytes]:
+    opcode, length = _HEADER.unpack(_recv_exactly(sock, _HEADER.size))
+    return _Opcode(opcode), _recv_exactly(sock, length)
+
+
+def _encode_packet(packet: cc1101._ReceivedPacket) -> bytes:
+    return (
+        _PACKET_HEADER.pack(
+            -1 if packet.realtime_ns is None else packet.realtime_ns,
+            packet._rssi_index,
+            packet.link_quality_indicator | (packet.checksum_valid << 7),
+        )
+        + packet.payload
+    )
+
+
+def _decode_packet(body: bytes) -> cc1101._ReceivedPacket:
+    realtime_ns, rssi_index, status = _PACKET_HEADER.unpack_from(body)
+    return cc1101._ReceivedPacket(
+        payload=body[_PACKET_HEADER.size :],
+        rssi_index=rssi_index,
+        checksum_valid=bool(status >> 7),
+        link_quality_indicator=status & 0x7F,
+        realtime_ns=None if realtime_ns < 0 else realtime_ns,
+    )
+
+
+class _RemoteSettings:
+    """
+    Records settings with the signatures of CC1101's setters
+    for transmission to the daemon.
+    """
+
+    def __init__(self) -> None:
+        self.encoded = b""
+
+    def _add(self, setting: _Setting, value: bytes) -> None:
+        self.encoded += bytes((setting, len(value))) + value
+
+    def set_base_frequency_hertz(self, freq: float) -> None:
+        self._add(_Setting.BASE_FREQUENCY_HERTZ, round(freq).to_bytes(4, "big"))
+
+    def set_symbol_rate_baud(self, real: float) -> None:
+        self._add(_Setting.SYMBOL_RATE_BAUD, round(real).to_bytes(4, "big"))
+
+    def set_sync_mode(self, mode: SyncMode) -> None:
+        self._add(_Setting.SYNC_MODE, bytes((mode,)))
+
+    def set_packet_length_mode(self, mode: PacketLengthMode) -> None:
+        self._add(_Setting.PACKET_LENGTH_MODE, bytes((mode,)))
+
+    def set_packet_length_bytes(self, packet_length: int) -> None:
+        self._add(_Setting.PACKET_LENGTH_BYTES, bytes((packet_length,)))
+
+    def disable_checksum(self) -> None:
+        self._add(_Setting.DISABLE_CHECKSUM, b"")
+
+    def set_output_power(self, power_settings: collections.abc.Iterable[int]) -> None:
+        self._add(_Setting.OUTPUT_POWER, bytes(power_settings))
+
+
+def _apply_settings(transceiver: cc1101.CC1101, encoded: bytes) -> None:
+    # decode all settings before applying any of them
+    settings = []
+    index = 0
+    while index < len(encoded):
+        if index + 2 > len(encoded) or index + 2 + encoded[index + 1] > len(encoded):
+            raise ValueError("truncated setting")
+        setting = _Setting(encoded[index])
+        settings.append((setting, encoded[index + 2 : index + 2 + encoded[index + 1]]))
+        index += 2 + encoded[index + 1]
+    for setting, value in settings:
+        if setting == _Setting.BASE_FREQUENCY_HERTZ:
+            transceiver.set_base_frequency_hertz(int.from_bytes(value, "big"))
+        elif setting == _Setting.SYMBOL_RATE_BAUD:
+            transceiver.set_symbol_rate_baud(int.from_bytes(value, "big"))
+        elif setting == _Setting.SYNC_MODE:
+            transceiver.set_sync_mode(SyncMode(value[0]))
+        elif setting == _Setting.PACKET_LENGTH_MODE:
+            transceiver.set_packet_length_mode(PacketLengthMode(value[0]))
+        elif setting == _Setting.PACKET_LENGTH_BYTES:
+            transceiver.set_packet_length_bytes(value[0])
+        elif setting == _Setting.DISABLE_CHECKSUM:
+            transceiver.disable_checksum()
+        else:
+            assert setting == _Setting.OUTPUT_POWER, setting
+            transceiver.set_output_power(value)
+
+
+class _Daemon:
+    """
+    Owns a configured transceiver and serves requests of local clients
+    via a unix domain socket.
+
+    Stays in RX state while clients are subscribed to received packets.
+    """
+
+    # pylint: disable=too-many-instance-attributes
+
+    def __init__(
+        self,
+        transceiver: cc1101.CC1101,
+        *,
+        socket_path: str = DEFAULT_SOCKET_PATH,
+        gdo0_gpio_line_name: bytes = b"GPIO24",  # recommended in README.md
+        poll_interval: datetime.timedelta = datetime.timedelta(milliseconds=1),
+    ) -> None:
+        self.transceiver = transceiver
+        self._socket_path = socket_path
+        self._gdo0_gpio_line_name = gdo0_gpio_line_name
+        self._poll_interval_seconds = poll_interval.total_seconds()
+        self._subscribers: set[socket.socket] = set()
+        self._gdo0: cc1101._gpio.GPIOLine | None = None
+        self._receiving = False
+        self._wakeup_fds: tuple[int, int] | None = None
+
+    def shutdown(self) -> None:
+        """
+        Make .serve_forever() return, may be called from other threads.
+        """
+        assert self._wakeup_fds is not None
+        os.write(self._wakeup_fds[1], b"\0")
+
+    def _enable_receive_mode(self) -> None:
+        assert self._gdo0 is not None
+        self.transceiver._command_strobe(StrobeAddress.SIDLE)
+        # > Only issue SFRX in IDLE or RXFIFO_OVERFLOW states.
+        self.transceiver._command_strobe(StrobeAddress.SFRX)
+        self._gdo0.read_events()  # discard stale events
+        self.transceiver._enable_receive_mode()
+        self._receiving = True
+
+    def _transmit(self, payload: bytes) -> None:
+        self.transceiver._command_strobe(StrobeAddress.SIDLE)
+        self._receiving = False
+        self.transceiver.transmit(payload)
+        while not self.transceiver._transmission_completed():
+            time.sleep(self._poll_interval_seconds)
+
+    def _export_config(self) -> bytes:
+        return bytes(self.transceiver.get_configuration_register_values().values()) + (
+            bytes(self.transceiver._get_patable())
+        )
+
+    def _handle_request(self, client: socket.socket) -> None:
+        opcode, body = _recv_message(client)
+        _LOGGER.debug("request %s with %d bytes", opcode.name, len(body))
+        response = b""
+        try:
+            if opcode == _Opcode.TRANSMIT:
+                self._transmit(body)
+            elif opcode == _Opcode.CONFIGURE:
+                self.transceiver._command_strobe(StrobeAddress.SIDLE)
+                self._receiving = False
+                _apply_settings(self.transceiver, body)
+            elif opcode == _Opcode.EXPORT_CONFIG:
+                response = self._export_config()
+            elif opcode == _Opcode.SUBSCRIBE:
+                self._subscribers.add(client)
+            else:
+                raise ValueError(f"unsupported request {opcode.name}")
+        except (ValueError, RuntimeError) as exc:
+            _send_message(client, _Opcode.ERROR, str(exc).encode())
+        else:
+            _send_message(client, _Opcode.OK, response)
+
+    def _publish_packet(self) -> None:
+        assert self._gdo0 is not None
+        edges = self._gdo0.read_events()
+        if not edges or not self._receiving:
+            return
+        # > RXOFF_MODE [default:] IDLE
+        self._receiving = False
+        packet = self.transceiver._get_received_packet(
+            monotonic_time_ns=edges[0],
+            realtime_ns=edges[0] + time.time_ns() - time.monotonic_ns(),
+        )
+        if packet is None:
+            return
+        body = _encode_packet(packet)
+        for subscriber in list(self._subscribers):
+            try:
+                _send_message(subscriber, _Opcode.PACKET, body)
+            except OSError:
+                self._subscribers.discard(subscriber)
+
+    def _serve(self, selector: selectors.BaseSelector, server: socket.socket) -> None:
+        assert self._gdo0 is not None and self._wakeup_fds is not None
+        selector.register(server, selectors.EVENT_READ, "server")
+        selector.register(self._wakeup_fds[0], selectors.EVENT_READ, "wakeup")
+        selector.register(self._gdo0.fileno(), selectors.EVENT_READ, "gdo0")
+        while True:
+            if self._subscribers and not self._receiving:
+                self._enable_receive_mode()
+            for key, _ in selector.select():
+                if key.data == "wakeup":
+                    return
+                if key.data == "server":
+                    client, _ = server.accept()
+                    client.settimeout(_CLIENT_TIMEOUT_SECONDS)
+                    selector.register(client, selectors.EVENT_READ, "client")
+                elif key.data == "gdo0":
+                    self._publish_packet()
+                else:
+                    client = typing.cast(socket.socket, key.fileobj)
+                    try:
+                        self._handle_request(client)
+                    except (OSError, ValueError):  # disconnected or invalid opcode
+                        self._subscribers.discard(client)
+                        selector.unregister(client)
+                        client.close()
+
+    def serve_forever(self) -> None:
+        self._wakeup_fds = os.pipe()
+        self._gdo0 = cc1101._gpio.GPIOLine.find(name=self._gdo0_gpio_line_name)
+        self._gdo0.request_rising_edge_events(consumer=b"CC1101:GDO0")
+        try:
+            with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as server:
+                if os.path.exists(self._socket_path):
+                    os.unlink(self._socket_path)  # left by crashed daemon
+                server.bind(self._socket_path)
+                server.listen()
+                _LOGGER.info("listening on %s", self._socket_path)
+                with selectors.DefaultSelector() as selector:
+                    try:
+                        self._serve(selector, server)
+                    finally:
+                        for key in list(selector.get_map().values()):
+                            if key.data == "client":
+                                typing.cast(socket.socket, key.fileobj).close()
+                os.unlink(self._socket_path)
+        finally:
+            self.transceiver._command_strobe(StrobeAddress.SIDLE)
+            self._gdo0.release()
+            self._gdo0 = None
+            self._subscribers.clear()
+            self._receiving = False
+            for fd in self._wakeup_fds:
+                os.close(fd)
+            self._wakeup_fds = None
+
+
+class _DaemonClient:
+    """
+    >>> with _DaemonClient() as client:
+    >>>     client.configure(settings)
+    >>>     client.transmit(b"message")
+    """
+
+    def __init__(self, socket_path: str = DEFAULT_SOCKET_PATH) -> None:
+        self._socket_path = socket_path
+        self._socket: socket.socket | None = None
+
+    def __enter__(self) -> _DaemonClient:
+        self._socket = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        try:
+            self._socket.connect(self._socket_path)
+        except OSError:
+            self._socket.close()
+            raise
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> typing.Literal[False]:
+        assert self._socket is not None
+        self._socket.close()
+        self._socket = None
+        return False
+
+    def _request(self, opcode: _Opcode, body: bytes = b"") -> bytes:
+        assert self._socket is not None
+        _send_message(self._socket, opcode, body)
+        response_opcode, response = _recv_message(self._socket)
+        if response_opcode == _Opcode.ERROR:
+            raise RuntimeError(f"daemon: {response.decode()}")
+        assert response_opcode == _Opcode.OK, response_opcode
+        return response
+
+    def configure(self, settings: _RemoteSettings) -> None:
+        if settings.encoded:
+            self._request(_Opcode.CONFIGURE, settings.encoded)
+
+    def transmit(self, payload: bytes) -> None:
+        """
+        Returns after the transmission completed.
+        """
+        self._request(_Opcode.TRANSMIT, payload)
+
+    def export_config(
+        self,
+    ) -> tuple[dict[ConfigurationRegisterAddress, int], tuple[int, ...]]:
+        """
+        Returns values of configuration registers and PATABLE.
+        """
+        response = self._request(_Opcode.EXPORT_CONFIG)
+        registers = list(ConfigurationRegisterAddress)
+        return (
+            dict(zip(registers, response[: len(registers)])),
+            tuple(response[len(registers) :]),
+        )
+
+    def packets(self) -> collections.abc.Iterator[cc1101._ReceivedPacket]:
+        """
+        Subscribe to packets received by the daemon.
+        """
+        self._request(_Opcode.SUBSCRIBE)
+        return self._iter_packets()
+
+    def _iter_packets(self) -> collections.abc.Iterator[cc1101._ReceivedPacket]:
+        assert self._socket is not None
+        while True:
+            opcode, body = _recv_message(self._socket)
+            assert opcode == _Opcode.PACKET, opcode
+            yield _decode_packet(body)
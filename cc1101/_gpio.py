@@ -22,24 +22,12 @@ import ctypes.util
 import datetime
 import errno
 import functools
+import os
 
 # could not find Debian's python3-libgpiod on pypi.org
 # https://salsa.debian.org/debian/libgpiod does not provide setup.py or setup.cfg
 
 
-@functools.lru_cache(maxsize=1)
-def _load_libgpiod() -> ctypes.CDLL:
-    filename = ctypes.util.find_library("gpiod")
-    if not filename:
-        raise FileNotFoundError(
-            "Failed to find libgpiod."
-            "\nOn Debian-based systems, like Raspberry Pi OS / Raspbian,"
-            " libgpiod can be installed via"
-            "\n\tsudo apt-get install --no-install-recommends libgpiod2"
-        )
-    return ctypes.CDLL(filename, use_errno=True)
-
-
 class _c_timespec(ctypes.Structure):
     """
     struct timespec {
@@ -53,18 +41,79 @@ class _c_timespec(ctypes.Structure):
     _fields_ = [("tv_sec", ctypes.c_long), ("tv_nsec", ctypes.c_long)]
 
 
+class _c_gpiod_line_event(ctypes.Structure):
+    """
+    struct gpiod_line_event {
+        struct timespec ts;
+        int event_type;
+    };
+    """
+
+    # pylint: disable=too-few-public-methods,invalid-name; struct
+
+    _fields_ = [("ts", _c_timespec), ("event_type", ctypes.c_int)]
+
+
+@functools.lru_cache(maxsize=1)
+def _load_libgpiod() -> ctypes.CDLL:
+    filename = ctypes.util.find_library("gpiod")
+    if not filename:
+        raise FileNotFoundError(
+            "Failed to find libgpiod."
+            "\nOn Debian-based systems, like Raspberry Pi OS / Raspbian,"
+            " libgpiod can be installed via"
+            "\n\tsudo apt-get install --no-install-recommends libgpiod2"
+        )
+    libgpiod = ctypes.CDLL(filename, use_errno=True)
+    # declare prototypes once to avoid ctypes' default int conversions
+    # (e.g., truncation of 64-bit pointers) on every call
+    # https://git.kernel.org/pub/scm/libs/libgpiod/libgpiod.git/tree/include/gpiod.h?h=v1.6.x
+    for name, restype, argtypes in (
+        ("gpiod_line_find", ctypes.c_void_p, [ctypes.c_char_p]),
+        ("gpiod_line_close_chip", None, [ctypes.c_void_p]),
+        (
+            "gpiod_line_request_rising_edge_events",
+            ctypes.c_int,
+            [ctypes.c_void_p, ctypes.c_char_p],
+        ),
+        ("gpiod_line_release", None, [ctypes.c_void_p]),
+        (
+            "gpiod_line_event_wait",
+            ctypes.c_int,
+            [ctypes.c_void_p, ctypes.POINTER(_c_timespec)],
+        ),
+        (
+            "gpiod_line_event_read",
+            ctypes.c_int,
+            [ctypes.c_void_p, ctypes.POINTER(_c_gpiod_line_event)],
+        ),
+        (
+            "gpiod_line_event_read_multiple",
+            ctypes.c_int,
+            [ctypes.c_void_p, ctypes.POINTER(_c_gpiod_line_event), ctypes.c_uint],
+        ),
+        ("gpiod_line_event_get_fd", ctypes.c_int, [ctypes.c_void_p]),
+    ):
+        function = getattr(libgpiod, name)
+        function.restype = restype
+        function.argtypes = argtypes
+    return libgpiod
+
+
 class GPIOLine:
     def __init__(self, pointer: ctypes.c_void_p) -> None:
         assert pointer != 0
+        self._libgpiod = _load_libgpiod()
         self._pointer = pointer
+        self._events_requested = False
 
     @classmethod
     def find(cls, name: bytes) -> GPIOLine:
         # > If this routine succeeds, the user must manually close the GPIO chip
         # > owning this line to avoid memory leaks.
-        pointer: int = _load_libgpiod().gpiod_line_find(name)
+        pointer: int | None = _load_libgpiod().gpiod_line_find(name)
         # > If the line could not be found, this functions sets errno to ENOENT.
-        if pointer == 0:
+        if not pointer:
             err = ctypes.get_errno()
             if err == errno.EACCES:
                 # > [PermissionError] corresponds to errno EACCES and EPERM.
@@ -91,34 +140,104 @@ class GPIOLine:
         # > Close a GPIO chip owning this line and release all resources.
         # > After this function returns, the line must no longer be used.
         if self._pointer:
-            _load_libgpiod().gpiod_line_close_chip(self._pointer)
+            self._libgpiod.gpiod_line_close_chip(self._pointer)
         # might make debugging easier in case someone calls __del__ twice
         self._pointer = None
 
-    def wait_for_rising_edge(
-        self, *, consumer: bytes, timeout: datetime.timedelta
-    ) -> bool:
-        """
-        Return True, if an event occured; False on timeout.
-        """
-        if (
-            _load_libgpiod().gpiod_line_request_rising_edge_events(
-                self._pointer, consumer
-            )
-            != 0
+    def _request_rising_edge_events(self, consumer: bytes) -> None:
+        if self._libgpiod.gpiod_line_request_rising_edge_events(
+            self._pointer, consumer
         ):
             err = ctypes.get_errno()
             raise OSError(
                 f"Request for rising edge event notifications failed ({errno.errorcode[err]})."
                 + ("\nBlocked by another process?" if err == errno.EBUSY else "")
             )
-        timeout_timespec = _c_timespec(
-            int(timeout.total_seconds()), timeout.microseconds * 1000
-        )
-        result: int = _load_libgpiod().gpiod_line_event_wait(
-            self._pointer, ctypes.pointer(timeout_timespec)
+
+    def request_rising_edge_events(self, *, consumer: bytes) -> None:
+        """
+        Request rising edge event notifications until .release() is called.
+
+        The kernel queues events in the meantime.
+        Use .fileno() to wait for them via select / poll / asyncio
+        and .read_events() to fetch them without blocking.
+        """
+        self._request_rising_edge_events(consumer)
+        self._events_requested = True
+        # gpiod_line_event_read*() shall return instead of blocking
+        # when no event is queued
+        os.set_blocking(self.fileno(), False)
+
+    def release(self) -> None:
+        self._libgpiod.gpiod_line_release(self._pointer)
+        self._events_requested = False
+
+    def fileno(self) -> int:
+        """
+        File descriptor becoming readable when events are queued.
+
+        Requires .request_rising_edge_events().
+        """
+        fileno: int = self._libgpiod.gpiod_line_event_get_fd(self._pointer)
+        if fileno < 0:
+            raise OSError(
+                "Failed to get file descriptor of GPIO line."
+                "\nCall .request_rising_edge_events() first."
+            )
+        return fileno
+
+    def read_events(self, max_events: int = 16) -> list[int]:
+        """
+        Return kernel timestamps (see .wait_for_rising_edge())
+        of up to max_events queued events.
+        Returns an empty list instead of blocking, if no event is queued.
+
+        Requires .request_rising_edge_events().
+        """
+        events = (_c_gpiod_line_event * max_events)()
+        count: int = self._libgpiod.gpiod_line_event_read_multiple(
+            self._pointer, events, max_events
         )
-        _load_libgpiod().gpiod_line_release(self._pointer)
-        if result == -1:
-            raise OSError("Failed to wait for rising edge event notification.")
-        return result == 1
+        if count < 0:
+            err = ctypes.get_errno()
+            if err in (errno.EAGAIN, errno.EWOULDBLOCK):
+                return []
+            raise OSError(f"Failed to read events ({errno.errorcode[err]}).")
+        return [e.ts.tv_sec * 10**9 + e.ts.tv_nsec for e in events[:count]]
+
+    def wait_for_rising_edge(
+        self, *, consumer: bytes, timeout: datetime.timedelta
+    ) -> int | None:
+        """
+        Return the kernel's timestamp of the event in nanoseconds; None on timeout.
+
+        Since linux v5.7 the timestamp is taken from CLOCK_MONOTONIC
+        (comparable with time.monotonic_ns()), older kernels use CLOCK_REALTIME.
+
+        Events are requested & released again, unless .request_rising_edge_events()
+        was called before (consumer is ignored in that case).
+        """
+        release = not self._events_requested
+        if release:
+            self._request_rising_edge_events(consumer)
+        try:
+            timeout_timespec = _c_timespec(
+                int(timeout.total_seconds()), timeout.microseconds * 1000
+            )
+            result: int = self._libgpiod.gpiod_line_event_wait(
+                self._pointer, ctypes.pointer(timeout_timespec)
+            )
+            if result == -1:
+                raise OSError("Failed to wait for rising edge event notification.")
+            if result == 0:
+                return None
+            # > Read the last event from the GPIO line.
+            event = _c_gpiod_line_event()
+            if self._libgpiod.gpiod_line_event_read(
+                self._pointer, ctypes.pointer(event)
+            ):
+                raise OSError("Failed to read rising edge event.")
+            return event.ts.tv_sec * 10**9 + event.ts.tv_nsec
+        finally:
+            if release:
+                self._libgpiod.gpiod_line_release(self._pointer)
@@ -0,0 +1,180 @@
+# python-cc1101 - Python Library to Transmit RF Signals via CC1101 Transceivers
+#
+# Copyright (C) 2026 Fabian Peter Hammerle <fabian@hammerle.me>
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+from __future__ import annotations
+
+import asyncio
+import collections.abc
+import concurrent.futures
+import datetime
+import functools
+import logging
+import time
+import typing
+
+import cc1101
+import cc1101._gpio
+from cc1101.addresses import StrobeAddress
+
+_LOGGER = logging.getLogger(__name__)
+
+_T = typing.TypeVar("_T")
+
+# pylint: disable=protected-access; unstable receive api of CC1101
+
+
+class AsyncCC1101:
+    """
+    Runs SPI transactions of a wrapped CC1101 on a dedicated executor thread
+    and waits for GDO0 edges via the event loop (instead of a blocking thread).
+
+    >>> transceiver = cc1101.CC1101(lock_spi_device=True)
+    >>> async with cc1101.aio.AsyncCC1101(transceiver) as radio:
+    >>>     await radio.call(transceiver.set_base_frequency_hertz, 433.92e6)
+    >>>     await radio.transmit(b"message")
+    >>>     await radio.wait_transmitted()
+    >>>     async for packet in radio.packets():
+    >>>         print(packet)
+
+    Cancelling .wait_transmitted() or a task iterating .packets()
+    returns the transceiver to IDLE state.
+    """
+
+    def __init__(
+        self,
+        transceiver: cc1101.CC1101,
+        *,
+        gdo0_gpio_line_name: bytes = b"GPIO24",  # recommended in README.md
+        run_spi_inline: bool = False,
+        poll_interval: datetime.timedelta = datetime.timedelta(milliseconds=1),
+    ) -> None:
+        """
+        run_spi_inline:
+            When True, SPI transactions block the event loop
+            instead of being delegated to the executor thread.
+            Reasonable for high SPI clock rates & short transactions.
+        poll_interval:
+            Interval of MARCSTATE reads in .wait_transmitted()
+        """
+        self.transceiver = transceiver
+        self._gdo0_gpio_line_name = gdo0_gpio_line_name
+        self._run_spi_inline = run_spi_inline
+        self._poll_interval_seconds = poll_interval.total_seconds()
+        self._executor: concurrent.futures.ThreadPoolExecutor | None = None
+        self._gdo0: cc1101._gpio.GPIOLine | None = None
+        self._rising_edges: asyncio.Queue[int] = asyncio.Queue()
+
+    async def call(
+        self, function: collections.abc.Callable[..., _T], *args, **kwargs
+    ) -> _T:
+        """
+        Call function (e.g., a bound method of .transceiver)
+        on the executor thread dedicated to this transceiver.
+        """
+        if self._run_spi_inline:
+            return function(*args, **kwargs)
+        return await asyncio.get_running_loop().run_in_executor(
+            self._executor, functools.partial(function, *args, **kwargs)
+        )
+
+    def _on_gdo0_readable(self) -> None:
+        assert self._gdo0 is not None
+        for timestamp_ns in self._gdo0.read_events():
+            self._rising_edges.put_nowait(timestamp_ns)
+
+    async def __aenter__(self) -> AsyncCC1101:
+        self._executor = concurrent.futures.ThreadPoolExecutor(
+            max_workers=1, thread_name_prefix="cc1101-spi"
+        )
+        try:
+            await self.call(self.transceiver.__enter__)
+            self._gdo0 = cc1101._gpio.GPIOLine.find(name=self._gdo0_gpio_line_name)
+            self._gdo0.request_rising_edge_events(consumer=b"CC1101:GDO0")
+        except:
+            await self.__aexit__(None, None, None)
+            raise
+        asyncio.get_running_loop().add_reader(
+            self._gdo0.fileno(), self._on_gdo0_readable
+        )
+        return self
+
+    async def __aexit__(self, exc_type, exc_value, traceback) -> typing.Literal[False]:
+        if self._gdo0 is not None:
+            if self._gdo0._events_requested:
+                asyncio.get_running_loop().remove_reader(self._gdo0.fileno())
+                self._gdo0.release()
+            self._gdo0 = None
+        assert self._executor is not None
+        await self.call(self.transceiver.__exit__, exc_type, exc_value, traceback)
+        self._executor.shutdown(wait=True)
+        self._executor = None
+        return False
+
+    async def _idle(self) -> None:
+        await self.call(self.transceiver._command_strobe, StrobeAddress.SIDLE)
+
+    async def transmit(self, payload: bytes) -> None:
+        """
+        see CC1101.transmit()
+
+        Returns after the transmission started, see .wait_transmitted().
+        """
+        await self.call(self.transceiver.transmit, payload)
+
+    async def wait_transmitted(self) -> None:
+        """
+        Wait until the transmission started by .transmit() is completed
+        and the transceiver returned to IDLE state.
+        """
+        try:
+            while not await self.call(self.transceiver._transmission_completed):
+                await asyncio.sleep(self._poll_interval_seconds)
+        except asyncio.CancelledError:
+            _LOGGER.debug("cancelled waiting for transmission, aborting")
+            await self._idle()
+            await self.call(self.transceiver._flush_tx_fifo_buffer)
+            raise
+
+    async def packets(self) -> collections.abc.AsyncIterator[cc1101._ReceivedPacket]:
+        """
+        Receive packets until the iteration is stopped or cancelled.
+
+        see CC1101._wait_for_packet()
+
+        The transceiver returns to IDLE state when the generator is closed.
+        Use contextlib.aclosing() to close it immediately after breaking the loop:
+        >>> async with contextlib.aclosing(radio.packets()) as packets:
+        >>>     async for packet in packets:
+        >>>         break
+        """
+        try:
+            while True:
+                while not self._rising_edges.empty():  # stale events
+                    self._rising_edges.get_nowait()
+                await self.call(self.transceiver._enable_receive_mode)
+                monotonic_time_ns = await self._rising_edges.get()
+                packet = await self.call(
+                    self.transceiver._get_received_packet,
+                    monotonic_time_ns=monotonic_time_ns,
+                    realtime_ns=monotonic_time_ns
+                    + time.time_ns()
+                    - time.monotonic_ns(),
+                )
+                if packet is not None:
+                    yield packet
+        finally:
+            await self._idle()
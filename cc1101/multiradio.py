@@ -0,0 +1,261 @@
+# python-cc1101 - Python Library to Transmit RF Signals via CC1101 Transceivers
+#
+# Copyright (C) 2026 Fabian Peter Hammerle <fabian@hammerle.me>
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+from __future__ import annotations
+
+import collections
+import contextlib
+import datetime
+import itertools
+import logging
+import os
+import queue
+import selectors
+import time
+import typing
+
+import cc1101
+import cc1101._gpio
+from cc1101.addresses import StatusRegisterAddress, StrobeAddress
+
+_LOGGER = logging.getLogger(__name__)
+
+# pylint: disable=protected-access; unstable receive api of CC1101
+
+
+class _Radio:
+    # pylint: disable=too-few-public-methods
+
+    def __init__(
+        self, radio_id: str, transceiver: cc1101.CC1101, gdo0_gpio_line_name: bytes
+    ) -> None:
+        self.radio_id = radio_id
+        self.transceiver = transceiver
+        self.gdo0_gpio_line_name = gdo0_gpio_line_name
+        self.gdo0: cc1101._gpio.GPIOLine | None = None
+        self.pending_payloads: collections.deque[bytes] = collections.deque()
+        self.receiving = False
+        self.transmitting = False
+
+    def receiving_frame(self) -> bool:
+        # > PKTSTATUS [3] SFD: [...] asserted when sync word has been received
+        # > and de-asserted at the end of the packet.
+        return self.receiving and bool(
+            self.transceiver._read_status_register(StatusRegisterAddress.PKTSTATUS)
+            & 0b00001000
+        )
+
+
+class MultiRadioManager:
+    """
+    Drives several transceivers from a single thread:
+    GDO0 event file descriptors of all radios are multiplexed in one poll loop.
+    Radios stay in RX state unless transmitting.
+
+    >>> manager = cc1101.multiradio.MultiRadioManager()
+    >>> manager.add_radio("433", cc1101.CC1101(spi_chip_select=0), gdo0_gpio_line_name=b"GPIO24")
+    >>> manager.add_radio("868", cc1101.CC1101(spi_chip_select=1), gdo0_gpio_line_name=b"GPIO25")
+    >>> with manager:
+    >>>     manager.submit(b"message")  # any radio
+    >>>     manager.broadcast(b"message")  # all radios
+    >>>     while True:
+    >>>         manager.poll()
+    >>>         while not manager.received_packets.empty():
+    >>>             radio_id, packet = manager.received_packets.get()
+
+    .submit() & .broadcast() may be called from other threads.
+    """
+
+    # pylint: disable=too-many-instance-attributes
+
+    def __init__(
+        self, *, poll_interval: datetime.timedelta = datetime.timedelta(milliseconds=1)
+    ) -> None:
+        """
+        poll_interval:
+            Maximum select timeout while transmissions are pending or in progress.
+        """
+        self._radios: dict[str, _Radio] = {}
+        self._poll_interval_seconds = poll_interval.total_seconds()
+        self.received_packets: queue.Queue[tuple[str, cc1101._ReceivedPacket]] = (
+            queue.Queue()
+        )
+        self._outbound: queue.SimpleQueue[tuple[str | None, bytes]] = (
+            queue.SimpleQueue()
+        )
+        self._rotation = itertools.count()
+        self._selector: selectors.BaseSelector | None = None
+        self._wakeup_fds: tuple[int, int] | None = None
+        self._exit_stack = contextlib.ExitStack()
+
+    @property
+    def radio_ids(self) -> list[str]:
+        return list(self._radios)
+
+    def add_radio(
+        self,
+        radio_id: str,
+        transceiver: cc1101.CC1101,
+        *,
+        gdo0_gpio_line_name: bytes,
+    ) -> None:
+        if self._selector is not None:
+            raise RuntimeError("radios must be added before entering the context")
+        if radio_id in self._radios:
+            raise ValueError(f"duplicate radio id {radio_id!r}")
+        self._radios[radio_id] = _Radio(radio_id, transceiver, gdo0_gpio_line_name)
+
+    def submit(self, payload: bytes, *, radio_id: str | None = None) -> None:
+        """
+        Queue payload for transmission via the given radio.
+        If radio_id is None, the radio with the fewest pending transmissions
+        is selected (round robin on ties).
+        """
+        if radio_id is not None and radio_id not in self._radios:
+            raise KeyError(radio_id)
+        self._outbound.put((radio_id, payload))
+        if self._wakeup_fds is not None:
+            os.write(self._wakeup_fds[1], b"\0")
+
+    def broadcast(self, payload: bytes) -> None:
+        """
+        Queue payload for transmission via all radios.
+        """
+        for radio_id in self._radios:
+            self.submit(payload, radio_id=radio_id)
+
+    def __enter__(self) -> MultiRadioManager:
+        with self._exit_stack:
+            self._selector = self._exit_stack.enter_context(selectors.DefaultSelector())
+            self._wakeup_fds = os.pipe()
+            self._exit_stack.callback(self._close_wakeup_fds)
+            self._selector.register(self._wakeup_fds[0], selectors.EVENT_READ, None)
+            for radio in self._radios.values():
+                self._exit_stack.enter_context(radio.transceiver)
+                radio.gdo0 = cc1101._gpio.GPIOLine.find(name=radio.gdo0_gpio_line_name)
+                radio.gdo0.request_rising_edge_events(
+                    consumer=b"CC1101:GDO0:" + radio.radio_id.encode()
+                )
+                self._exit_stack.callback(self._stop_radio, radio)
+                self._selector.register(
+                    radio.gdo0.fileno(), selectors.EVENT_READ, radio
+                )
+            # keep callbacks for __exit__
+            self._exit_stack = self._exit_stack.pop_all()
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> typing.Literal[False]:
+        self._exit_stack.close()
+        return False
+
+    def _close_wakeup_fds(self) -> None:
+        assert self._wakeup_fds is not None
+        for fd in self._wakeup_fds:
+            os.close(fd)
+        self._wakeup_fds = None
+        self._selector = None
+
+    @staticmethod
+    def _stop_radio(radio: _Radio) -> None:
+        assert radio.gdo0 is not None
+        radio.transceiver._command_strobe(StrobeAddress.SIDLE)
+        radio.gdo0.release()
+        radio.gdo0 = None
+        radio.receiving = radio.transmitting = False
+
+    def _dispatch_outbound(self) -> None:
+        while True:
+            try:
+                radio_id, payload = self._outbound.get_nowait()
+            except queue.Empty:
+                return
+            if radio_id is None:
+                rotation = next(self._rotation) % len(self._radios)
+                radios = list(self._radios.values())
+                radio = min(
+                    radios[rotation:] + radios[:rotation],
+                    key=lambda r: len(r.pending_payloads) + r.transmitting,
+                )
+            else:
+                radio = self._radios[radio_id]
+            radio.pending_payloads.append(payload)
+
+    @staticmethod
+    def _update_radio(radio: _Radio) -> None:
+        if radio.transmitting:
+            if not radio.transceiver._transmission_completed():
+                return
+            radio.transmitting = False
+        if radio.pending_payloads and not radio.receiving_frame():
+            radio.transceiver._command_strobe(StrobeAddress.SIDLE)
+            radio.receiving = False
+            payload = radio.pending_payloads.popleft()
+            try:
+                radio.transceiver.transmit(payload)
+            except ValueError:  # unsupported payload length
+                _LOGGER.exception(
+                    "failed to transmit %r via radio %r", payload, radio.radio_id
+                )
+                return
+            radio.transmitting = True
+        elif not radio.receiving and not radio.pending_payloads:
+            assert radio.gdo0 is not None
+            radio.transceiver._command_strobe(StrobeAddress.SIDLE)
+            # > Only issue SFRX in IDLE or RXFIFO_OVERFLOW states.
+            radio.transceiver._command_strobe(StrobeAddress.SFRX)
+            radio.gdo0.read_events()  # discard stale events
+            radio.transceiver._enable_receive_mode()
+            radio.receiving = True
+
+    def _receive(self, radio: _Radio) -> None:
+        assert radio.gdo0 is not None
+        edges = radio.gdo0.read_events()
+        if not edges or not radio.receiving:
+            return
+        # > RXOFF_MODE [default:] IDLE
+        radio.receiving = False
+        packet = radio.transceiver._get_received_packet(
+            monotonic_time_ns=edges[0],
+            realtime_ns=edges[0] + time.time_ns() - time.monotonic_ns(),
+        )
+        if packet is not None:
+            self.received_packets.put((radio.radio_id, packet))
+
+    def poll(self, timeout: datetime.timedelta | None = None) -> None:
+        """
+        Run one iteration of the poll loop:
+        start pending transmissions, resume RX on idle radios
+        and wait up to timeout for received packets (None: wait indefinitely).
+        Received packets are put into .received_packets tagged with the radio id.
+        """
+        if self._selector is None or self._wakeup_fds is None:
+            raise RuntimeError("manager must be entered via `with` before polling")
+        self._dispatch_outbound()
+        for radio in self._radios.values():
+            self._update_radio(radio)
+        timeout_seconds = None if timeout is None else timeout.total_seconds()
+        if any(
+            r.transmitting or r.pending_payloads for r in self._radios.values()
+        ) and (
+            timeout_seconds is None or timeout_seconds > self._poll_interval_seconds
+        ):
+            timeout_seconds = self._poll_interval_seconds
+        for key, _ in self._selector.select(timeout=timeout_seconds):
+            if key.data is None:
+                os.read(self._wakeup_fds[0], 64)
+            else:
+                self._receive(key.data)
@@ -0,0 +1,243 @@
+# python-cc1101 - Python Library to Transmit RF Signals via CC1101 Transceivers
+#
+# Copyright (C) 2026 Fabian Peter Hammerle <fabian@hammerle.me>
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+from __future__ import annotations
+
+import mmap
+import os
+import pathlib
+import struct
+import typing
+
+import cc1101
+
+# pylint: disable=protected-access; _ReceivedPacket._rssi_index
+
+# magic, slot count, write sequence (number of packets written so far)
+_HEADER = struct.Struct("<4sI8xQ")
+_MAGIC = b"CCRB"
+# sequence (0 while being written), realtime_ns & monotonic_time_ns (-1 if unknown),
+# RSSI, LQI | CRC_OK << 7, payload length
+_SLOT_HEADER = struct.Struct("<QqqBBB5x")
+_SEQUENCE = struct.Struct("<Q")
+# > The packet length is defined as the payload data, [...]
+# > Any packet length up to 255 bytes can be used.
+_PAYLOAD_CAPACITY_BYTES = 256
+_SLOT_SIZE_BYTES = _SLOT_HEADER.size + _PAYLOAD_CAPACITY_BYTES
+_WRITE_SEQUENCE_OFFSET = _HEADER.size - _SEQUENCE.size
+
+
+def _slot_offset(sequence: int, slot_count: int) -> int:
+    return _HEADER.size + ((sequence - 1) % slot_count) * _SLOT_SIZE_BYTES
+
+
+class RingBufferWriter:
+    """
+    Single producer publishing received packets to any number of local
+    consumer processes via a memory-mapped file (see RingBufferReader).
+
+    >>> with cc1101.ringbuffer.RingBufferWriter("/dev/shm/cc1101") as ring:
+    >>>     for packet in ...:  # e.g., HalfDuplexScheduler.received_packets
+    >>>         ring.write(packet)
+
+    Slots are overwritten without waiting for consumers.
+    """
+
+    def __init__(self, path: str | os.PathLike, *, slot_count: int = 64) -> None:
+        if slot_count < 1:
+            raise ValueError(f"expected at least one slot, got {slot_count}")
+        self._path = pathlib.Path(path)
+        self._slot_count = slot_count
+        self._mmap: mmap.mmap | None = None
+        self._sequence = 0
+
+    def __enter__(self) -> RingBufferWriter:
+        size = _HEADER.size + self._slot_count * _SLOT_SIZE_BYTES
+        with self._path.open("w+b") as ring_file:
+            ring_file.truncate(size)
+            self._mmap = mmap.mmap(ring_file.fileno(), size)
+        _HEADER.pack_into(self._mmap, 0, _MAGIC, self._slot_count, 0)
+        self._sequence = 0
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> typing.Literal[False]:
+        assert self._mmap is not None
+        self._mmap.close()
+        self._mmap = None
+        return False
+
+    def write(self, packet: cc1101._ReceivedPacket) -> None:
+        assert self._mmap is not None
+        if len(packet.payload) > _PAYLOAD_CAPACITY_BYTES:
+            raise ValueError(
+                f"payload exceeds slot capacity of {_PAYLOAD_CAPACITY_BYTES} bytes"
+            )
+        self._sequence += 1
+        offset = _slot_offset(self._sequence, self._slot_count)
+        # sequence 0 invalidates the slot for readers while it is being written
+        _SLOT_HEADER.pack_into(
+            self._mmap,
+            offset,
+            0,
+            -1 if packet.realtime_ns is None else packet.realtime_ns,
+            -1 if packet.monotonic_time_ns is None else packet.monotonic_time_ns,
+            packet._rssi_index,
+            packet.link_quality_indicator | (packet.checksum_valid << 7),
+            len(packet.payload),
+        )
+        payload_offset = offset + _SLOT_HEADER.size
+        self._mmap[payload_offset : payload_offset + len(packet.payload)] = (
+            packet.payload
+        )
+        _SEQUENCE.pack_into(self._mmap, offset, self._sequence)
+        _SEQUENCE.pack_into(self._mmap, _WRITE_SEQUENCE_OFFSET, self._sequence)
+
+
+class RingBufferRecord:
+    """
+    Packet in a slot of the ring buffer, .payload refers to the shared memory.
+
+    The writer may overwrite the slot at any time:
+    Call .is_valid() after processing the payload & discard the results if False.
+    """
+
+    # pylint: disable=too-few-public-methods,too-many-instance-attributes
+
+    def __init__(  # pylint: disable=too-many-arguments
+        self,
+        *,
+        ring_mmap: mmap.mmap,
+        sequence: int,
+        offset: int,
+        realtime_ns: int,
+        monotonic_time_ns: int,
+        rssi_index: int,
+        status: int,
+        payload: memoryview,
+    ) -> None:
+        self._mmap = ring_mmap
+        self.sequence = sequence
+        self._offset = offset
+        self.realtime_ns = None if realtime_ns < 0 else realtime_ns
+        self.monotonic_time_ns = None if monotonic_time_ns < 0 else monotonic_time_ns
+        self.rssi_index = rssi_index
+        self.checksum_valid = bool(status >> 7)
+        self.link_quality_indicator = status & 0x7F
+        self.payload = payload
+
+    def is_valid(self) -> bool:
+        return _SEQUENCE.unpack_from(self._mmap, self._offset)[0] == self.sequence
+
+
+class RingBufferReader:
+    """
+    Attaches to the ring buffer of a RingBufferWriter,
+    each reader keeps track of its own position.
+
+    >>> with cc1101.ringbuffer.RingBufferReader("/dev/shm/cc1101") as ring:
+    >>>     while True:
+    >>>         packet = ring.read()  # None if no new packet is available
+    >>>         print(ring.dropped_packets)  # overwritten before being read
+
+    Only packets written after attaching are read.
+    """
+
+    def __init__(self, path: str | os.PathLike) -> None:
+        self._path = pathlib.Path(path)
+        self._mmap: mmap.mmap | None = None
+        self._slot_count = 0
+        self._cursor = 0
+        self.dropped_packets = 0
+
+    def __enter__(self) -> RingBufferReader:
+        with self._path.open("rb") as ring_file:
+            self._mmap = mmap.mmap(ring_file.fileno(), 0, access=mmap.ACCESS_READ)
+        magic, self._slot_count, write_sequence = _HEADER.unpack_from(self._mmap)
+        if magic != _MAGIC:
+            self._mmap.close()
+            self._mmap = None
+            raise ValueError(f"{self._path} is not a ring buffer")
+        self._cursor = write_sequence + 1
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> typing.Literal[False]:
+        assert self._mmap is not None
+        # raises BufferError while payloads of records are referenced
+        self._mmap.close()
+        self._mmap = None
+        return False
+
+    def read_view(self) -> RingBufferRecord | None:
+        """
+        Returns the next packet without copying its payload
+        or None if no new packet is available.
+
+        Release the record's .payload before leaving the context.
+        """
+        assert self._mmap is not None
+        while True:
+            (write_sequence,) = _SEQUENCE.unpack_from(
+                self._mmap, _WRITE_SEQUENCE_OFFSET
+            )
+            if self._cursor > write_sequence:
+                return None
+            if write_sequence - self._cursor >= self._slot_count:
+                oldest_sequence = write_sequence - self._slot_count + 1
+                self.dropped_packets += oldest_sequence - self._cursor
+                self._cursor = oldest_sequence
+            offset = _slot_offset(self._cursor, self._slot_count)
+            sequence, realtime_ns, monotonic_time_ns, rssi_index, status, length = (
+                _SLOT_HEADER.unpack_from(self._mmap, offset)
+            )
+            if sequence != self._cursor:
+                continue  # overwritten meanwhile
+            payload_offset = offset + _SLOT_HEADER.size
+            self._cursor += 1
+            return RingBufferRecord(
+                ring_mmap=self._mmap,
+                sequence=sequence,
+                offset=offset,
+                realtime_ns=realtime_ns,
+                monotonic_time_ns=monotonic_time_ns,
+                rssi_index=rssi_index,
+                status=status,
+                payload=memoryview(self._mmap)[
+                    payload_offset : payload_offset + length
+                ],
+            )
+
+    def read(self) -> cc1101._ReceivedPacket | None:
+        """
+        Returns a copy of the next packet or None if no new packet is available.
+        """
+        while True:
+            record = self.read_view()
+            if record is None:
+                return None
+            with record.payload:
+                payload = record.payload.tobytes()
+            if not record.is_valid():
+                self.dropped_packets += 1
+                continue
+            return cc1101._ReceivedPacket(
+                payload=payload,
+                rssi_index=record.rssi_index,
+                checksum_valid=record.checksum_valid,
+                link_quality_indicator=record.link_quality_indicator,
+                monotonic_time_ns=record.monotonic_time_ns,
+                realtime_ns=record.realtime_ns,
+            )
@@ -0,0 +1,255 @@
+# python-cc1101 - Python Library to Transmit RF Signals via CC1101 Transceivers
+#
+# Copyright (C) 2026 Fabian Peter Hammerle <fabian@hammerle.me>
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+from __future__ import annotations
+
+import concurrent.futures
+import datetime
+import functools
+import itertools
+import logging
+import os
+import queue
+import selectors
+import threading
+import time
+import typing
+
+import cc1101
+import cc1101._gpio
+from cc1101.addresses import StatusRegisterAddress, StrobeAddress
+
+_LOGGER = logging.getLogger(__name__)
+
+# pylint: disable=protected-access; unstable receive api of CC1101
+
+
+class ThreadSafeCC1101:
+    """
+    Serializes all method calls of the wrapped CC1101 via a reentrant lock.
+
+    >>> transceiver = cc1101.threadsafe.ThreadSafeCC1101(cc1101.CC1101())
+    >>> with transceiver:
+    >>>     transceiver.set_base_frequency_hertz(433.92e6)  # from any thread
+
+    Hold .lock to run a sequence of calls without interruption:
+    >>> with transceiver.lock:
+    >>>     transceiver.set_packet_length_mode(cc1101.PacketLengthMode.FIXED)
+    >>>     transceiver.set_packet_length_bytes(4)
+    """
+
+    def __init__(self, transceiver: cc1101.CC1101) -> None:
+        self.transceiver = transceiver
+        self.lock = threading.RLock()
+
+    def __getattr__(self, name: str) -> typing.Any:
+        attr = getattr(self.transceiver, name)
+        if not callable(attr):
+            return attr
+
+        @functools.wraps(attr)
+        def _locked(*args, **kwargs):
+            with self.lock:
+                return attr(*args, **kwargs)
+
+        return _locked
+
+    def __enter__(self) -> ThreadSafeCC1101:
+        with self.lock:
+            self.transceiver.__enter__()
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> typing.Literal[False]:
+        with self.lock:
+            return self.transceiver.__exit__(exc_type, exc_value, traceback)
+
+    def __str__(self) -> str:
+        with self.lock:
+            return str(self.transceiver)
+
+
+class HalfDuplexScheduler:
+    """
+    Keeps the transceiver in RX state on a background thread
+    and interleaves transmissions of submitted frames.
+
+    Transmissions preempt reception only when no packet is being received
+    (PKTSTATUS.SFD unset), RX resumes after each transmission.
+    Frames with lower priority values are transmitted first.
+
+    >>> with cc1101.CC1101() as transceiver, HalfDuplexScheduler(transceiver) as scheduler:
+    >>>     scheduler.submit(b"urgent", priority=-1).result()  # wait for transmission
+    >>>     print(scheduler.received_packets.get())
+    """
+
+    # pylint: disable=too-many-instance-attributes
+
+    def __init__(
+        self,
+        transceiver: cc1101.CC1101 | ThreadSafeCC1101,
+        *,
+        gdo0_gpio_line_name: bytes = b"GPIO24",  # recommended in README.md
+        poll_interval: datetime.timedelta = datetime.timedelta(milliseconds=1),
+    ) -> None:
+        """
+        poll_interval:
+            Interval of status register reads while waiting for the end of a
+            transmission or for the end of a packet delaying a transmission.
+        """
+        self.transceiver = (
+            transceiver
+            if isinstance(transceiver, ThreadSafeCC1101)
+            else ThreadSafeCC1101(transceiver)
+        )
+        self._gdo0_gpio_line_name = gdo0_gpio_line_name
+        self._poll_interval_seconds = poll_interval.total_seconds()
+        self.received_packets: queue.Queue[cc1101._ReceivedPacket] = queue.Queue()
+        self._transmit_queue: queue.PriorityQueue[
+            tuple[int, int, bytes, concurrent.futures.Future[None]]
+        ] = queue.PriorityQueue()
+        self._sequence = itertools.count()
+        self._wakeup_fds: tuple[int, int] | None = None
+        self._stop = threading.Event()
+        self._thread: threading.Thread | None = None
+
+    def submit(
+        self, payload: bytes, *, priority: int = 0
+    ) -> concurrent.futures.Future[None]:
+        """
+        Queue payload for transmission, thread-safe.
+
+        The returned future completes after the transmission
+        (or raises, e.g., ValueError for an unsupported payload length).
+        """
+        future: concurrent.futures.Future[None] = concurrent.futures.Future()
+        self._transmit_queue.put((priority, next(self._sequence), payload, future))
+        self._wakeup()
+        return future
+
+    def _wakeup(self) -> None:
+        if self._wakeup_fds is not None:
+            os.write(self._wakeup_fds[1], b"\0")
+
+    def _receiving_frame(self) -> bool:
+        # > PKTSTATUS [3] SFD: Start of Frame Delimiter. In RX, this bit is
+        # > asserted when sync word has been received and de-asserted at the
+        # > end of the packet.
+        return bool(
+            self.transceiver._read_status_register(StatusRegisterAddress.PKTSTATUS)
+            & 0b00001000
+        )
+
+    def _transmit_next(self) -> None:
+        priority, _, payload, future = self._transmit_queue.get_nowait()
+        if not future.set_running_or_notify_cancel():
+            return
+        _LOGGER.debug("transmitting queued frame with priority %d", priority)
+        try:
+            with self.transceiver.lock:
+                self.transceiver._command_strobe(StrobeAddress.SIDLE)
+                self.transceiver.transmit(payload)
+            while not self.transceiver._transmission_completed():
+                time.sleep(self._poll_interval_seconds)
+        except Exception as exc:  # pylint: disable=broad-exception-caught; passed on
+            future.set_exception(exc)
+        else:
+            future.set_result(None)
+
+    def _receive(self, monotonic_time_ns: int) -> None:
+        packet = self.transceiver._get_received_packet(
+            monotonic_time_ns=monotonic_time_ns,
+            realtime_ns=monotonic_time_ns + time.time_ns() - time.monotonic_ns(),
+        )
+        if packet is not None:
+            self.received_packets.put(packet)
+
+    def _run(self, gdo0: cc1101._gpio.GPIOLine) -> None:
+        assert self._wakeup_fds is not None
+        with selectors.DefaultSelector() as selector:
+            selector.register(gdo0.fileno(), selectors.EVENT_READ, gdo0)
+            selector.register(self._wakeup_fds[0], selectors.EVENT_READ, None)
+            receiving = False
+            while not self._stop.is_set():
+                transmit_pending = not self._transmit_queue.empty()
+                if transmit_pending and not (receiving and self._receiving_frame()):
+                    self._transmit_next()
+                    receiving = False
+                    continue
+                if not receiving:
+                    with self.transceiver.lock:
+                        self.transceiver._command_strobe(StrobeAddress.SIDLE)
+                        # > Only issue SFRX in IDLE or RXFIFO_OVERFLOW states.
+                        self.transceiver._command_strobe(StrobeAddress.SFRX)
+                        gdo0.read_events()  # discard stale events
+                        self.transceiver._enable_receive_mode()
+                    receiving = True
+                for key, _ in selector.select(
+                    timeout=self._poll_interval_seconds if transmit_pending else None
+                ):
+                    if key.data is None:
+                        os.read(self._wakeup_fds[0], 64)
+                        continue
+                    edges = gdo0.read_events()
+                    if edges:
+                        # > RXOFF_MODE [default:] IDLE
+                        receiving = False
+                        self._receive(edges[0])
+        self.transceiver._command_strobe(StrobeAddress.SIDLE)
+
+    def _run_and_release(self, gdo0: cc1101._gpio.GPIOLine) -> None:
+        try:
+            self._run(gdo0)
+        finally:
+            gdo0.release()
+            while not self._transmit_queue.empty():
+                future = self._transmit_queue.get_nowait()[3]
+                if future.set_running_or_notify_cancel():
+                    future.set_exception(RuntimeError("scheduler stopped"))
+
+    def start(self) -> None:
+        assert self._thread is None
+        gdo0 = cc1101._gpio.GPIOLine.find(name=self._gdo0_gpio_line_name)
+        gdo0.request_rising_edge_events(consumer=b"CC1101:GDO0")
+        self._wakeup_fds = os.pipe()
+        self._stop.clear()
+        self._thread = threading.Thread(
+            target=self._run_and_release, args=(gdo0,), name="cc1101-scheduler"
+        )
+        self._thread.start()
+
+    def stop(self) -> None:
+        """
+        Stop the background thread and return the transceiver to IDLE state.
+
+        Pending transmissions fail with RuntimeError.
+        """
+        assert self._thread is not None and self._wakeup_fds is not None
+        self._stop.set()
+        self._wakeup()
+        self._thread.join()
+        self._thread = None
+        for fd in self._wakeup_fds:
+            os.close(fd)
+        self._wakeup_fds = None
+
+    def __enter__(self) -> HalfDuplexScheduler:
+        self.start()
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> typing.Literal[False]:
+        self.stop()
+        return False
@@ -59,6 +59,7 @@ setuptools.setup(
     ],
     entry_points={
         "console_scripts": [
+            "cc1101-daemon = cc1101._cli:_daemon",
             "cc1101-export-config = cc1101._cli:_export_config",
             "cc1101-transmit = cc1101._cli:_transmit",
         ]
@@ -1,3 +1,4 @@
+import os
 import unittest.mock
 
 import pytest
@@ -16,3 +17,36 @@ def libgpiod_mock():
     mock = unittest.mock.MagicMock()
     with unittest.mock.patch("cc1101._gpio._load_libgpiod", return_value=mock):
         yield mock
+
+
+@pytest.fixture(scope="function")
+def gdo0_line_mock():
+    """
+    GPIOLine with a pipe as event file descriptor,
+    write 8-byte big-endian timestamps to the yielded fd to emit events
+    """
+    read_fd, write_fd = os.pipe()
+    os.set_blocking(read_fd, False)
+    line_mock = unittest.mock.MagicMock()
+    line_mock.fileno.return_value = read_fd
+    line_mock._events_requested = True  # pylint: disable=protected-access
+
+    def _read_events():
+        try:
+            data = os.read(read_fd, 1024)
+        except BlockingIOError:
+            return []
+        return [int.from_bytes(data[i : i + 8], "big") for i in range(0, len(data), 8)]
+
+    line_mock.read_events.side_effect = _read_events
+    with unittest.mock.patch(
+        "cc1101._gpio.GPIOLine.find", return_value=line_mock
+    ) as find_mock:
+        yield find_mock, line_mock, write_fd
+    os.close(read_fd)
+    os.close(write_fd)
+
+
+@pytest.fixture(scope="function")
+def transceiver_mock():
+    return unittest.mock.MagicMock(spec=cc1101.CC1101)
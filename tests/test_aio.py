@@ -0,0 +1,185 @@
+# python-cc1101 - Python Library to Transmit RF Signals via CC1101 Transceivers
+#
+# Copyright (C) 2026 Fabian Peter Hammerle <fabian@hammerle.me>
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+import asyncio
+import contextlib
+import os
+import threading
+import unittest.mock
+
+import pytest
+
+import cc1101
+import cc1101.aio
+from cc1101.addresses import StrobeAddress
+
+# pylint: disable=protected-access
+
+
+def test_context(transceiver_mock, gdo0_line_mock):
+    find_mock, line_mock, _ = gdo0_line_mock
+    spi_threads = []
+    transceiver_mock.__enter__.side_effect = lambda: spi_threads.append(
+        threading.current_thread()
+    )
+
+    async def _main():
+        async with cc1101.aio.AsyncCC1101(
+            transceiver_mock, gdo0_gpio_line_name=b"GPIO25"
+        ) as radio:
+            assert radio.transceiver is transceiver_mock
+            transceiver_mock.__enter__.assert_called_once_with()
+            line_mock.request_rising_edge_events.assert_called_once_with(
+                consumer=b"CC1101:GDO0"
+            )
+            line_mock.release.assert_not_called()
+            transceiver_mock.__exit__.assert_not_called()
+
+    asyncio.run(_main())
+    find_mock.assert_called_once_with(name=b"GPIO25")
+    assert spi_threads[0] is not threading.main_thread()
+    line_mock.release.assert_called_once_with()
+    transceiver_mock.__exit__.assert_called_once_with(None, None, None)
+
+
+def test_context_gpio_failure(transceiver_mock):
+    async def _main():
+        async with cc1101.aio.AsyncCC1101(transceiver_mock):
+            pass  # pragma: no cover
+
+    with unittest.mock.patch(
+        "cc1101._gpio.GPIOLine.find", side_effect=FileNotFoundError
+    ), pytest.raises(FileNotFoundError):
+        asyncio.run(_main())
+    transceiver_mock.__enter__.assert_called_once_with()
+    transceiver_mock.__exit__.assert_called_once_with(None, None, None)
+
+
+def test_context_request_failure(transceiver_mock, gdo0_line_mock):
+    _, line_mock, _ = gdo0_line_mock
+    line_mock._events_requested = False
+    line_mock.request_rising_edge_events.side_effect = OSError
+
+    async def _main():
+        async with cc1101.aio.AsyncCC1101(transceiver_mock):
+            pass  # pragma: no cover
+
+    with pytest.raises(OSError):
+        asyncio.run(_main())
+    line_mock.release.assert_not_called()
+    transceiver_mock.__exit__.assert_called_once_with(None, None, None)
+
+
+@pytest.mark.parametrize("run_spi_inline", (False, True))
+def test_transmit(transceiver_mock, gdo0_line_mock, run_spi_inline):
+    # pylint: disable=unused-argument; gdo0_line_mock
+    transceiver_mock._transmission_completed.side_effect = [False, False, True]
+
+    async def _main():
+        async with cc1101.aio.AsyncCC1101(
+            transceiver_mock, run_spi_inline=run_spi_inline
+        ) as radio:
+            await radio.transmit(b"message")
+            await radio.wait_transmitted()
+
+    asyncio.run(_main())
+    transceiver_mock.transmit.assert_called_once_with(b"message")
+    assert transceiver_mock._transmission_completed.call_count == 3
+    transceiver_mock._command_strobe.assert_not_called()
+
+
+def test_wait_transmitted_underflow(transceiver_mock, gdo0_line_mock):
+    # pylint: disable=unused-argument; gdo0_line_mock
+    transceiver_mock._transmission_completed.side_effect = RuntimeError("underflow")
+
+    async def _main():
+        async with cc1101.aio.AsyncCC1101(transceiver_mock) as radio:
+            await radio.wait_transmitted()
+
+    with pytest.raises(RuntimeError, match=r"^underflow$"):
+        asyncio.run(_main())
+    transceiver_mock._command_strobe.assert_not_called()
+
+
+def test_wait_transmitted_cancel(transceiver_mock, gdo0_line_mock):
+    # pylint: disable=unused-argument; gdo0_line_mock
+    transceiver_mock._transmission_completed.return_value = False
+
+    async def _main():
+        async with cc1101.aio.AsyncCC1101(transceiver_mock) as radio:
+            with pytest.raises(TimeoutError):
+                await asyncio.wait_for(radio.wait_transmitted(), timeout=0.05)
+
+    asyncio.run(_main())
+    transceiver_mock._command_strobe.assert_called_once_with(StrobeAddress.SIDLE)
+    transceiver_mock._flush_tx_fifo_buffer.assert_called_once_with()
+
+
+def test_packets(transceiver_mock, gdo0_line_mock):
+    _, _, write_fd = gdo0_line_mock
+    transceiver_mock._get_received_packet.side_effect = ["packet-0", None, "packet-1"]
+    os.write(write_fd, (1).to_bytes(8, "big"))  # stale event, queued before RX
+    timestamps_ns = iter((21, 42, 43))
+    # edge reported by kernel after entering RX
+    transceiver_mock._enable_receive_mode.side_effect = lambda: os.write(
+        write_fd, next(timestamps_ns).to_bytes(8, "big")
+    )
+
+    async def _main():
+        received = []
+        async with cc1101.aio.AsyncCC1101(transceiver_mock) as radio:
+            await asyncio.sleep(0.01)  # read stale event
+            async with contextlib.aclosing(radio.packets()) as packets:
+                async for packet in packets:
+                    received.append(packet)
+                    if len(received) == 2:
+                        break
+            transceiver_mock._command_strobe.assert_called_once_with(
+                StrobeAddress.SIDLE
+            )
+        return received
+
+    with unittest.mock.patch("time.time_ns", return_value=10**9):
+        with unittest.mock.patch("time.monotonic_ns", return_value=100):
+            assert asyncio.run(_main()) == ["packet-0", "packet-1"]
+    assert transceiver_mock._enable_receive_mode.call_count == 3
+    assert transceiver_mock._get_received_packet.call_args_list == [
+        unittest.mock.call(monotonic_time_ns=21, realtime_ns=10**9 - 100 + 21),
+        unittest.mock.call(monotonic_time_ns=42, realtime_ns=10**9 - 100 + 42),
+        unittest.mock.call(monotonic_time_ns=43, realtime_ns=10**9 - 100 + 43),
+    ]
+
+
+def test_packets_cancel(transceiver_mock, gdo0_line_mock):
+    # pylint: disable=unused-argument; gdo0_line_mock
+
+    async def _receive(radio):
+        async for _ in radio.packets():
+            pass  # pragma: no cover
+
+    async def _main():
+        async with cc1101.aio.AsyncCC1101(transceiver_mock) as radio:
+            task = asyncio.create_task(_receive(radio))
+            await asyncio.sleep(0.01)
+            transceiver_mock._enable_receive_mode.assert_called_once_with()
+            task.cancel()
+            with pytest.raises(asyncio.CancelledError):
+                await task
+
+    asyncio.run(_main())
+    transceiver_mock._command_strobe.assert_called_once_with(StrobeAddress.SIDLE)
+    transceiver_mock._get_received_packet.assert_not_called()
@@ -0,0 +1,64 @@
+# python-cc1101 - Python Library to Transmit RF Signals via CC1101 Transceivers
+#
+# Copyright (C) 2026 Fabian Peter Hammerle <fabian@hammerle.me>
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+import logging
+import signal
+import unittest.mock
+
+import pytest
+
+import cc1101._cli
+
+# pylint: disable=protected-access
+
+
+@pytest.mark.parametrize(
+    ("args", "socket_path", "gdo0_gpio_line_name"),
+    (
+        ([""], "/run/cc1101.sock", b"GPIO24"),
+        (
+            ["", "--socket-path", "/tmp/cc.sock", "--gdo0-gpio-line-name", "GPIO25"],
+            "/tmp/cc.sock",
+            b"GPIO25",
+        ),
+    ),
+)
+def test_daemon(caplog, args, socket_path, gdo0_gpio_line_name):
+    with unittest.mock.patch(
+        "cc1101.CC1101"
+    ) as transceiver_class_mock, unittest.mock.patch(
+        "cc1101._daemon._Daemon"
+    ) as daemon_class_mock, unittest.mock.patch(
+        "signal.signal"
+    ) as signal_mock, unittest.mock.patch(
+        "sys.argv", args + ["-f", "433920000"]
+    ), caplog.at_level(
+        logging.INFO
+    ):
+        daemon_class_mock().serve_forever.side_effect = KeyboardInterrupt
+        cc1101._cli._daemon()
+    transceiver_class_mock.assert_called_once_with(lock_spi_device=True)
+    with transceiver_class_mock() as transceiver_mock:
+        pass
+    transceiver_mock.set_base_frequency_hertz.assert_called_once_with(433920000)
+    daemon_class_mock.assert_called_with(
+        transceiver_mock,
+        socket_path=socket_path,
+        gdo0_gpio_line_name=gdo0_gpio_line_name,
+    )
+    signal_mock.assert_called_once_with(signal.SIGTERM, signal.default_int_handler)
+    assert caplog.record_tuples[-1] == ("cc1101._cli", logging.INFO, "stopping")
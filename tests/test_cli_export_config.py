@@ -137,3 +137,27 @@ def test_logging(caplog):
         "args=Namespace(base_frequency_hertz=None, "
     )
     assert caplog.record_tuples[1] == ("cc1101._cli", logging.INFO, "dummystr")
+
+
+def test_daemon(capsys):
+    # pylint: disable=duplicate-code
+    with unittest.mock.patch(
+        "cc1101.CC1101"
+    ) as transceiver_class_mock, unittest.mock.patch(
+        "cc1101._daemon._DaemonClient"
+    ) as client_class_mock, unittest.mock.patch(
+        "sys.argv", ["", "-f", "433920000", "--daemon"]
+    ):
+        with client_class_mock() as client_mock:
+            client_mock.export_config.return_value = (
+                {cc1101.addresses.ConfigurationRegisterAddress.IOCFG2: 0x29},
+                (0xC6,),
+            )
+        cc1101._cli._export_config()
+    transceiver_class_mock.assert_not_called()
+    client_class_mock.assert_called_with("/run/cc1101.sock")
+    assert client_mock.configure.call_args.args[0].encoded == b"\x01\x04" + (
+        433920000
+    ).to_bytes(4, "big")
+    out, _ = capsys.readouterr()
+    assert out == "[\n0b00101001, # 0x29 IOCFG2\n]\n# PATABLE = (0xc6,)\n"
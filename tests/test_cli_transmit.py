@@ -217,3 +217,35 @@ def test_logging(caplog, payload):
         "args=Namespace(base_frequency_hertz=None, "
     )
     assert caplog.record_tuples[1] == ("cc1101._cli", logging.INFO, "dummy")
+
+
+@pytest.mark.parametrize(
+    ("args", "socket_path"),
+    (
+        (["", "--daemon"], "/run/cc1101.sock"),
+        (["", "-l", "fixed", "--daemon", "/tmp/cc1101.sock"], "/tmp/cc1101.sock"),
+    ),
+)
+def test_daemon(args, socket_path):
+    stdin_mock = unittest.mock.MagicMock()
+    stdin_mock.buffer = io.BytesIO(b"message")
+    with unittest.mock.patch(
+        "cc1101.CC1101"
+    ) as transceiver_class_mock, unittest.mock.patch(
+        "cc1101._daemon._DaemonClient"
+    ) as client_class_mock, unittest.mock.patch(
+        "sys.stdin", stdin_mock
+    ), unittest.mock.patch(
+        "sys.argv", args
+    ):
+        cc1101._cli._transmit()
+    transceiver_class_mock.assert_not_called()
+    client_class_mock.assert_called_once_with(socket_path)
+    with client_class_mock() as client_mock:
+        pass
+    client_mock.transmit.assert_called_once_with(b"message")
+    settings = client_mock.configure.call_args.args[0]
+    if "fixed" in args:
+        assert settings.encoded == b"\x04\x01\x00\x05\x01\x07"
+    else:
+        assert settings.encoded == b""
@@ -0,0 +1,248 @@
+# python-cc1101 - Python Library to Transmit RF Signals via CC1101 Transceivers
+#
+# Copyright (C) 2026 Fabian Peter Hammerle <fabian@hammerle.me>
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+import os
+import socket
+import threading
+import time
+import unittest.mock
+
+import pytest
+
+import cc1101
+import cc1101._daemon
+from cc1101.addresses import ConfigurationRegisterAddress, StrobeAddress
+from cc1101.options import PacketLengthMode, SyncMode
+
+# pylint: disable=protected-access,redefined-outer-name
+
+_TIMEOUT_SECONDS = 4
+
+
+def _wait_for(condition) -> None:
+    deadline = time.monotonic() + _TIMEOUT_SECONDS
+    while not condition():
+        assert time.monotonic() < deadline
+        time.sleep(0.001)
+
+
+@pytest.fixture(scope="function")
+def daemon(transceiver_mock, gdo0_line_mock, tmp_path):
+    socket_path = str(tmp_path.joinpath("cc1101.sock"))
+    tmp_path.joinpath("cc1101.sock").write_bytes(b"")  # left by crashed daemon
+    transceiver_mock._transmission_completed.side_effect = [False, True] * 8
+    daemon = cc1101._daemon._Daemon(transceiver_mock, socket_path=socket_path)
+    thread = threading.Thread(target=daemon.serve_forever)
+    thread.start()
+    _wait_for(lambda: _accepting(socket_path))
+    yield daemon, socket_path, gdo0_line_mock
+    daemon.shutdown()
+    thread.join()
+    assert not os.path.exists(socket_path)
+    gdo0_line_mock[1].release.assert_called_once_with()
+    assert transceiver_mock._command_strobe.call_args_list[-1] == unittest.mock.call(
+        StrobeAddress.SIDLE
+    )
+
+
+def _accepting(socket_path: str) -> bool:
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+        try:
+            sock.connect(socket_path)
+        except (ConnectionRefusedError, FileNotFoundError):
+            return False
+    return True
+
+
+def test_transmit(transceiver_mock, daemon):
+    _, socket_path, _ = daemon
+    with cc1101._daemon._DaemonClient(socket_path) as client:
+        client.transmit(b"message")
+        client.transmit(b"message2")
+    assert transceiver_mock.transmit.call_args_list == [
+        unittest.mock.call(b"message"),
+        unittest.mock.call(b"message2"),
+    ]
+    assert transceiver_mock._transmission_completed.call_count == 4
+
+
+def test_transmit_error(transceiver_mock, daemon):
+    _, socket_path, _ = daemon
+    transceiver_mock.transmit.side_effect = ValueError("payload too long")
+    with cc1101._daemon._DaemonClient(socket_path) as client:
+        with pytest.raises(RuntimeError, match=r"^daemon: payload too long$"):
+            client.transmit(b"message")
+        transceiver_mock.transmit.side_effect = None
+        client.transmit(b"message")
+
+
+def test_configure(transceiver_mock, daemon):
+    _, socket_path, _ = daemon
+    settings = cc1101._daemon._RemoteSettings()
+    settings.set_base_frequency_hertz(433.92e6)
+    settings.set_symbol_rate_baud(2400)
+    settings.set_sync_mode(SyncMode.NO_PREAMBLE_AND_SYNC_WORD)
+    settings.set_packet_length_mode(PacketLengthMode.FIXED)
+    settings.set_packet_length_bytes(4)
+    settings.disable_checksum()
+    settings.set_output_power((0, 0xC6))
+    with cc1101._daemon._DaemonClient(socket_path) as client:
+        client.configure(cc1101._daemon._RemoteSettings())
+        transceiver_mock._command_strobe.assert_not_called()
+        client.configure(settings)
+    assert transceiver_mock.mock_calls == [
+        unittest.mock.call._command_strobe(StrobeAddress.SIDLE),
+        unittest.mock.call.set_base_frequency_hertz(433920000),
+        unittest.mock.call.set_symbol_rate_baud(2400),
+        unittest.mock.call.set_sync_mode(SyncMode.NO_PREAMBLE_AND_SYNC_WORD),
+        unittest.mock.call.set_packet_length_mode(PacketLengthMode.FIXED),
+        unittest.mock.call.set_packet_length_bytes(4),
+        unittest.mock.call.disable_checksum(),
+        unittest.mock.call.set_output_power(b"\x00\xc6"),
+    ]
+
+
+@pytest.mark.parametrize(
+    ("settings", "error"),
+    (
+        (b"\x05", "truncated setting"),
+        (b"\x05\x01\x04\x01\x02\x00", "truncated setting"),
+        (b"\x05\x01\x04\x42\x00", "66 is not a valid _Setting"),
+    ),
+)
+def test_configure_invalid(transceiver_mock, daemon, settings, error):
+    _, socket_path, _ = daemon
+    remote_settings = cc1101._daemon._RemoteSettings()
+    remote_settings.encoded = settings
+    with cc1101._daemon._DaemonClient(socket_path) as client:
+        with pytest.raises(RuntimeError, match=r"^daemon: " + error + "$"):
+            client.configure(remote_settings)
+    transceiver_mock.set_packet_length_bytes.assert_not_called()
+
+
+def test_export_config(transceiver_mock, daemon):
+    _, socket_path, _ = daemon
+    register_values = {r: r.value + 1 for r in ConfigurationRegisterAddress}
+    transceiver_mock.get_configuration_register_values.return_value = register_values
+    transceiver_mock._get_patable.return_value = (0xC6,) + (0,) * 7
+    with cc1101._daemon._DaemonClient(socket_path) as client:
+        assert client.export_config() == (register_values, (0xC6,) + (0,) * 7)
+
+
+def test_invalid_request(daemon):
+    _, socket_path, _ = daemon
+    with cc1101._daemon._DaemonClient(socket_path) as client:
+        with pytest.raises(RuntimeError, match=r"^daemon: unsupported request OK$"):
+            client._request(cc1101._daemon._Opcode.OK)
+        assert client._socket is not None
+        client._socket.sendall(b"\x42\x00\x00")  # invalid opcode
+        with pytest.raises(ConnectionError):
+            cc1101._daemon._recv_message(client._socket)
+
+
+def test_subscribe(transceiver_mock, daemon):
+    _, socket_path, (_, _, write_fd) = daemon
+    transceiver_mock._get_received_packet.side_effect = [
+        None,
+        cc1101._ReceivedPacket(
+            payload=b"\x01\x02",
+            rssi_index=0x80,
+            checksum_valid=True,
+            link_quality_indicator=0x12,
+        ),
+    ]
+    with cc1101._daemon._DaemonClient(socket_path) as client:
+        packets = client.packets()
+        with cc1101._daemon._DaemonClient(socket_path) as other_client:
+            other_packets = other_client.packets()
+            _wait_for(lambda: transceiver_mock._enable_receive_mode.call_count == 1)
+            os.write(write_fd, (21).to_bytes(8, "big"))
+            _wait_for(lambda: transceiver_mock._enable_receive_mode.call_count == 2)
+            os.write(write_fd, (42).to_bytes(8, "big"))
+            packet = next(other_packets)
+        received = next(packets)
+    assert str(packet) == str(received) == "_ReceivedPacket(RSSI -138dBm, 0x0102)"
+    assert received.checksum_valid
+    assert received.link_quality_indicator == 0x12
+    assert received.realtime_ns is None
+    assert [
+        c.kwargs["monotonic_time_ns"]
+        for c in transceiver_mock._get_received_packet.call_args_list
+    ] == [21, 42]
+
+
+def test_publish_packet_disconnected(transceiver_mock, gdo0_line_mock):
+    _, line_mock, write_fd = gdo0_line_mock
+    transceiver_mock._get_received_packet.return_value = cc1101._ReceivedPacket(
+        payload=b"\x01",
+        rssi_index=0,
+        checksum_valid=False,
+        link_quality_indicator=0,
+        realtime_ns=1234,
+    )
+    daemon = cc1101._daemon._Daemon(transceiver_mock)
+    daemon._gdo0 = line_mock
+    subscriber, peer = socket.socketpair()
+    peer.close()
+    daemon._subscribers.add(subscriber)
+    daemon._publish_packet()  # no events
+    daemon._receiving = True
+    os.write(write_fd, (21).to_bytes(8, "big"))
+    daemon._publish_packet()
+    assert not daemon._subscribers
+    subscriber.close()
+    transceiver_mock._get_received_packet.assert_called_once()
+
+
+def test_packet_encoding():
+    packet = cc1101._daemon._decode_packet(
+        cc1101._daemon._encode_packet(
+            cc1101._ReceivedPacket(
+                payload=b"\xff",
+                rssi_index=0x7F,
+                checksum_valid=False,
+                link_quality_indicator=0x7F,
+                realtime_ns=1234,
+            )
+        )
+    )
+    assert packet.payload == b"\xff"
+    assert packet._rssi_index == 0x7F
+    assert not packet.checksum_valid
+    assert packet.link_quality_indicator == 0x7F
+    assert packet.realtime_ns == 1234
+
+
+def test_client_connect_failure(tmp_path):
+    with pytest.raises(FileNotFoundError):
+        with cc1101._daemon._DaemonClient(str(tmp_path.joinpath("missing.sock"))):
+            pass  # pragma: no cover
+
+
+def test_shutdown_connected_client(transceiver_mock, gdo0_line_mock, tmp_path):
+    # pylint: disable=unused-argument; gdo0_line_mock
+    socket_path = str(tmp_path.joinpath("cc1101.sock"))
+    daemon = cc1101._daemon._Daemon(transceiver_mock, socket_path=socket_path)
+    thread = threading.Thread(target=daemon.serve_forever)
+    thread.start()
+    _wait_for(lambda: _accepting(socket_path))
+    with cc1101._daemon._DaemonClient(socket_path) as client:
+        client.transmit(b"message")
+        daemon.shutdown()
+        thread.join()
+        assert client._socket is not None
+        assert not client._socket.recv(1)  # closed by daemon
@@ -30,11 +30,24 @@ import cc1101._gpio
 
 
 def test__load_libgpiod():
+    cc1101._gpio._load_libgpiod.cache_clear()
     with unittest.mock.patch(
-        "ctypes.util.find_library", return_value=ctypes.util.find_library("c")
-    ) as find_library_mock:
-        assert isinstance(cc1101._gpio._load_libgpiod(), ctypes.CDLL)
+        "ctypes.util.find_library", return_value="libgpiod.so.2"
+    ) as find_library_mock, unittest.mock.patch("ctypes.CDLL") as cdll_mock:
+        assert cc1101._gpio._load_libgpiod() == cdll_mock.return_value
     find_library_mock.assert_called_once_with("gpiod")
+    cdll_mock.assert_called_once_with("libgpiod.so.2", use_errno=True)
+    libgpiod = cdll_mock.return_value
+    assert libgpiod.gpiod_line_find.restype == ctypes.c_void_p
+    assert libgpiod.gpiod_line_find.argtypes == [ctypes.c_char_p]
+    assert libgpiod.gpiod_line_close_chip.restype is None
+    assert libgpiod.gpiod_line_event_get_fd.restype == ctypes.c_int
+    assert libgpiod.gpiod_line_event_read_multiple.argtypes == [
+        ctypes.c_void_p,
+        ctypes.POINTER(cc1101._gpio._c_gpiod_line_event),
+        ctypes.c_uint,
+    ]
+    cc1101._gpio._load_libgpiod.cache_clear()
 
 
 def test_load_libgpiod_not_found():
@@ -75,6 +88,14 @@ def test_line_find_unknown_error(libgpiod_mock, name):
         cc1101._gpio.GPIOLine.find(name.encode())
 
 
+@pytest.mark.parametrize("pointer", (0, None))  # NULL with & without restype
+def test_line_find_null(libgpiod_mock, pointer):
+    libgpiod_mock.gpiod_line_find.return_value = pointer
+    ctypes.set_errno(errno.ENOENT)
+    with pytest.raises(FileNotFoundError):
+        cc1101._gpio.GPIOLine.find(b"GPIO24")
+
+
 def test_line_find(libgpiod_mock):
     libgpiod_mock.gpiod_line_find.return_value = 21
     line = cc1101._gpio.GPIOLine.find(b"GPIO24")
@@ -99,10 +120,24 @@ def test_line_wait_for_rising_edge(
     line = cc1101._gpio.GPIOLine(pointer=pointer)
     libgpiod_mock.gpiod_line_request_rising_edge_events.return_value = 0
     libgpiod_mock.gpiod_line_event_wait.return_value = 0 if reached_timeout else 1
-    event_occured = line.wait_for_rising_edge(
+
+    def _event_read(line_pointer, event_pointer) -> int:
+        assert line_pointer == pointer
+        event_pointer.contents.ts.tv_sec = 1621
+        event_pointer.contents.ts.tv_nsec = 42
+        event_pointer.contents.event_type = 1  # GPIOD_LINE_EVENT_RISING_EDGE
+        return 0
+
+    libgpiod_mock.gpiod_line_event_read.side_effect = _event_read
+    timestamp_ns = line.wait_for_rising_edge(
         consumer=consumer, timeout=datetime.timedelta(seconds=timeout_seconds)
     )
-    assert event_occured is not reached_timeout
+    if reached_timeout:
+        assert timestamp_ns is None
+        libgpiod_mock.gpiod_line_event_read.assert_not_called()
+    else:
+        assert timestamp_ns == 1621 * 10**9 + 42
+        libgpiod_mock.gpiod_line_event_read.assert_called_once()
     libgpiod_mock.gpiod_line_request_rising_edge_events.assert_called_once_with(
         pointer, consumer
     )
@@ -147,3 +182,101 @@ def test_line_wait_for_rising_edge_wait_failed(libgpiod_mock) -> None:
         line.wait_for_rising_edge(
             consumer=b"test", timeout=datetime.timedelta(seconds=1)
         )
+
+
+def test_line_wait_for_rising_edge_read_failed(libgpiod_mock) -> None:
+    pointer = ctypes.c_void_p(21)
+    line = cc1101._gpio.GPIOLine(pointer=pointer)
+    libgpiod_mock.gpiod_line_request_rising_edge_events.return_value = 0
+    libgpiod_mock.gpiod_line_event_wait.return_value = 1
+    libgpiod_mock.gpiod_line_event_read.return_value = -1
+    with pytest.raises(OSError, match=r"^Failed to read rising edge event\.$"):
+        line.wait_for_rising_edge(
+            consumer=b"test", timeout=datetime.timedelta(seconds=1)
+        )
+    libgpiod_mock.gpiod_line_release.assert_called_once_with(pointer)
+
+
+def test_line_request_rising_edge_events(libgpiod_mock) -> None:
+    pointer = ctypes.c_void_p(1234)
+    line = cc1101._gpio.GPIOLine(pointer=pointer)
+    libgpiod_mock.gpiod_line_request_rising_edge_events.return_value = 0
+    libgpiod_mock.gpiod_line_event_get_fd.return_value = 21
+    with unittest.mock.patch("os.set_blocking") as set_blocking_mock:
+        line.request_rising_edge_events(consumer=b"CC1101:GDO0")
+    libgpiod_mock.gpiod_line_request_rising_edge_events.assert_called_once_with(
+        pointer, b"CC1101:GDO0"
+    )
+    set_blocking_mock.assert_called_once_with(21, False)
+    assert line.fileno() == 21
+    # persistent request: no request & release per wait
+    libgpiod_mock.gpiod_line_event_wait.return_value = 0
+    assert (
+        line.wait_for_rising_edge(
+            consumer=b"ignored", timeout=datetime.timedelta(seconds=1)
+        )
+        is None
+    )
+    libgpiod_mock.gpiod_line_request_rising_edge_events.assert_called_once()
+    libgpiod_mock.gpiod_line_release.assert_not_called()
+    line.release()
+    libgpiod_mock.gpiod_line_release.assert_called_once_with(pointer)
+    libgpiod_mock.gpiod_line_event_wait.return_value = 0
+    line.wait_for_rising_edge(consumer=b"test", timeout=datetime.timedelta(seconds=1))
+    assert libgpiod_mock.gpiod_line_request_rising_edge_events.call_count == 2
+    assert libgpiod_mock.gpiod_line_release.call_count == 2
+
+
+def test_line_request_rising_edge_events_busy(libgpiod_mock) -> None:
+    line = cc1101._gpio.GPIOLine(pointer=ctypes.c_void_p(1234))
+    libgpiod_mock.gpiod_line_request_rising_edge_events.return_value = -1
+    ctypes.set_errno(errno.EBUSY)
+    with pytest.raises(OSError, match=r"\(EBUSY\)"):
+        line.request_rising_edge_events(consumer=b"test")
+    assert not line._events_requested
+
+
+def test_line_fileno_not_requested(libgpiod_mock) -> None:
+    line = cc1101._gpio.GPIOLine(pointer=ctypes.c_void_p(1234))
+    libgpiod_mock.gpiod_line_event_get_fd.return_value = -1
+    with pytest.raises(OSError, match=r"^Failed to get file descriptor"):
+        line.fileno()
+
+
+@pytest.mark.parametrize("max_events", (1, 16))
+def test_line_read_events(libgpiod_mock, max_events: int) -> None:
+    pointer = ctypes.c_void_p(1234)
+    line = cc1101._gpio.GPIOLine(pointer=pointer)
+
+    def _read_multiple(line_pointer, events, num_events) -> int:
+        assert line_pointer == pointer
+        assert num_events == len(events) == max_events
+        count = min(2, num_events)
+        for index in range(count):
+            events[index].ts.tv_sec = 100 + index
+            events[index].ts.tv_nsec = 42
+        return count
+
+    libgpiod_mock.gpiod_line_event_read_multiple.side_effect = _read_multiple
+    assert (
+        line.read_events(max_events=max_events)
+        == [
+            100 * 10**9 + 42,
+            101 * 10**9 + 42,
+        ][:max_events]
+    )
+
+
+def test_line_read_events_none_queued(libgpiod_mock) -> None:
+    line = cc1101._gpio.GPIOLine(pointer=ctypes.c_void_p(1234))
+    libgpiod_mock.gpiod_line_event_read_multiple.return_value = -1
+    ctypes.set_errno(errno.EAGAIN)
+    assert line.read_events() == []
+
+
+def test_line_read_events_failed(libgpiod_mock) -> None:
+    line = cc1101._gpio.GPIOLine(pointer=ctypes.c_void_p(1234))
+    libgpiod_mock.gpiod_line_event_read_multiple.return_value = -1
+    ctypes.set_errno(errno.EIO)
+    with pytest.raises(OSError, match=r"^Failed to read events \(EIO\)\.$"):
+        line.read_events()
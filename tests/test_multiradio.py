@@ -0,0 +1,213 @@
+# python-cc1101 - Python Library to Transmit RF Signals via CC1101 Transceivers
+#
+# Copyright (C) 2026 Fabian Peter Hammerle <fabian@hammerle.me>
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+import datetime
+import functools
+import logging
+import os
+import unittest.mock
+
+import pytest
+
+import cc1101
+import cc1101.multiradio
+from cc1101.addresses import StatusRegisterAddress, StrobeAddress
+
+# pylint: disable=protected-access,redefined-outer-name
+
+_NO_WAIT = datetime.timedelta(0)
+
+
+def _read_events(fd: int) -> list[int]:
+    try:
+        return [42] * len(os.read(fd, 64))
+    except BlockingIOError:
+        return []
+
+
+@pytest.fixture(scope="function")
+def radios():
+    """
+    two transceiver mocks with GDO0 lines using pipes as event fds
+    """
+    radios = {}
+    for radio_id, line_name in (("a", b"GPIO24"), ("b", b"GPIO25")):
+        read_fd, write_fd = os.pipe()
+        os.set_blocking(read_fd, False)
+        line_mock = unittest.mock.MagicMock()
+        line_mock.fileno.return_value = read_fd
+        line_mock.read_events.side_effect = functools.partial(_read_events, read_fd)
+        transceiver_mock = unittest.mock.MagicMock(spec=cc1101.CC1101)
+        transceiver_mock._read_status_register.return_value = 0  # PKTSTATUS
+        transceiver_mock._transmission_completed.return_value = True
+        radios[radio_id] = (transceiver_mock, line_name, line_mock, write_fd)
+    lines = {r[1]: r[2] for r in radios.values()}
+    with unittest.mock.patch(
+        "cc1101._gpio.GPIOLine.find", side_effect=lambda name: lines[name]
+    ):
+        yield radios
+    for _, _, line_mock, write_fd in radios.values():
+        os.close(line_mock.fileno.return_value)
+        os.close(write_fd)
+
+
+@pytest.fixture(scope="function")
+def manager(radios):
+    manager = cc1101.multiradio.MultiRadioManager()
+    for radio_id, (transceiver_mock, line_name, _, _) in radios.items():
+        manager.add_radio(radio_id, transceiver_mock, gdo0_gpio_line_name=line_name)
+    return manager
+
+
+def test_add_radio(manager, radios):
+    assert manager.radio_ids == ["a", "b"]
+    with pytest.raises(ValueError, match=r"^duplicate radio id 'a'$"):
+        manager.add_radio("a", radios["a"][0], gdo0_gpio_line_name=b"GPIO24")
+    with manager:
+        with pytest.raises(RuntimeError):
+            manager.add_radio("c", radios["a"][0], gdo0_gpio_line_name=b"GPIO26")
+
+
+def test_context(manager, radios):
+    with pytest.raises(RuntimeError, match=r"\bentered\b"):
+        manager.poll(timeout=_NO_WAIT)
+    with manager as entered:
+        assert entered is manager
+        for transceiver_mock, _, line_mock, _ in radios.values():
+            transceiver_mock.__enter__.assert_called_once()
+            line_mock.request_rising_edge_events.assert_called_once()
+            line_mock.release.assert_not_called()
+    assert radios["a"][2].request_rising_edge_events.call_args == unittest.mock.call(
+        consumer=b"CC1101:GDO0:a"
+    )
+    for transceiver_mock, _, line_mock, _ in radios.values():
+        transceiver_mock.__exit__.assert_called_once()
+        line_mock.release.assert_called_once_with()
+        transceiver_mock._command_strobe.assert_called_with(StrobeAddress.SIDLE)
+
+
+def test_context_failure(manager, radios):
+    radios["b"][0].__enter__.side_effect = PermissionError
+    with pytest.raises(PermissionError):
+        with manager:
+            pass  # pragma: no cover
+    radios["a"][0].__exit__.assert_called_once()
+    radios["a"][2].release.assert_called_once_with()
+    radios["b"][0].__exit__.assert_not_called()
+    assert manager._wakeup_fds is None
+
+
+def test_receive(manager, radios):
+    radios["a"][0]._get_received_packet.return_value = "packet-a"
+    radios["b"][0]._get_received_packet.side_effect = [None, "packet-b"]
+    with manager:
+        manager.poll(timeout=_NO_WAIT)
+        for transceiver_mock, _, _, _ in radios.values():
+            transceiver_mock._enable_receive_mode.assert_called_once_with()
+        os.write(radios["b"][3], b"\0")
+        manager.poll(timeout=datetime.timedelta(seconds=1))
+        assert manager.received_packets.empty()
+        manager.poll(timeout=_NO_WAIT)  # resumes RX for b
+        os.write(radios["a"][3], b"\0")
+        os.write(radios["b"][3], b"\0")
+        while manager.received_packets.qsize() < 2:
+            manager.poll(timeout=datetime.timedelta(seconds=1))
+    received = []
+    while not manager.received_packets.empty():
+        received.append(manager.received_packets.get_nowait())
+    assert sorted(received) == [("a", "packet-a"), ("b", "packet-b")]
+    assert radios["b"][0]._enable_receive_mode.call_count == 2
+    radios["a"][0]._get_received_packet.assert_called_once()
+    assert radios["a"][0]._get_received_packet.call_args.kwargs[
+        "monotonic_time_ns"
+    ] == (42)
+
+
+def test_receive_stale_event(manager, radios):
+    with manager:
+        os.write(radios["a"][3], b"\0")
+        manager._radios["a"].receiving = False
+        manager.poll(timeout=_NO_WAIT)  # stale event discarded when entering RX
+        manager._radios["a"].receiving = False
+        os.write(radios["a"][3], b"\0")
+        manager._receive(manager._radios["a"])
+    radios["a"][0]._get_received_packet.assert_not_called()
+
+
+def test_submit_load_balance(manager, radios):
+    for transceiver_mock, _, _, _ in radios.values():
+        transceiver_mock._transmission_completed.return_value = False
+    with manager:
+        manager.poll(timeout=_NO_WAIT)
+        manager.submit(b"0")
+        manager.submit(b"1")
+        manager.submit(b"2")
+        manager.poll(timeout=datetime.timedelta(seconds=4))
+        radios["a"][0].transmit.assert_called_once_with(b"0")
+        radios["b"][0].transmit.assert_called_once_with(b"1")
+        assert list(manager._radios["a"].pending_payloads) == [b"2"]
+        radios["a"][0]._transmission_completed.return_value = True
+        manager.poll(timeout=_NO_WAIT)
+        assert radios["a"][0].transmit.call_args_list == [
+            unittest.mock.call(b"0"),
+            unittest.mock.call(b"2"),
+        ]
+        manager.poll(timeout=_NO_WAIT)
+        assert radios["a"][0]._enable_receive_mode.call_count == 2
+    with pytest.raises(KeyError):
+        manager.submit(b"", radio_id="c")
+
+
+def test_broadcast(manager, radios):
+    with manager:
+        manager.broadcast(b"message")
+        manager.poll(timeout=_NO_WAIT)
+    for transceiver_mock, _, _, _ in radios.values():
+        transceiver_mock.transmit.assert_called_once_with(b"message")
+        transceiver_mock._enable_receive_mode.assert_not_called()
+
+
+def test_submit_defer_while_receiving_frame(manager, radios):
+    radios["a"][0]._read_status_register.return_value = 0b00001000  # SFD
+    with manager:
+        manager.poll(timeout=_NO_WAIT)
+        manager.submit(b"message", radio_id="a")
+        manager.poll(timeout=_NO_WAIT)
+        radios["a"][0].transmit.assert_not_called()
+        radios["a"][0]._read_status_register.assert_called_with(
+            StatusRegisterAddress.PKTSTATUS
+        )
+        radios["a"][0]._read_status_register.return_value = 0
+        manager.poll(timeout=_NO_WAIT)
+    radios["a"][0].transmit.assert_called_once_with(b"message")
+
+
+def test_submit_invalid_payload(caplog, manager, radios):
+    radios["a"][0].transmit.side_effect = ValueError("payload too long")
+    with manager, caplog.at_level(logging.ERROR):
+        manager.submit(b"message", radio_id="a")
+        manager.poll(timeout=_NO_WAIT)
+        assert not manager._radios["a"].transmitting
+        manager.poll(timeout=_NO_WAIT)
+        radios["a"][0]._enable_receive_mode.assert_called_once_with()
+    assert caplog.record_tuples == [
+        (
+            "cc1101.multiradio",
+            logging.ERROR,
+            "failed to transmit b'message' via radio 'a'",
+        )
+    ]
@@ -46,6 +46,8 @@ def test__get_received_packet(transceiver, payload):
     assert received_packet._rssi_index == 128
     assert received_packet.checksum_valid
     assert received_packet.link_quality_indicator == 42
+    assert received_packet.monotonic_time_ns is None
+    assert received_packet.timestamp is None
     with unittest.mock.patch.object(
         transceiver, "_read_status_register", return_value=0
     ):
@@ -57,7 +59,9 @@ def test__get_received_packet(transceiver, payload):
 @pytest.mark.parametrize("timeout", (datetime.timedelta(seconds=4),))
 def test__wait_for_packet(transceiver, gdo0_gpio_line_name, timeout, reached_timeout):
     line_mock = unittest.mock.MagicMock()
-    line_mock.wait_for_rising_edge.return_value = not reached_timeout
+    line_mock.wait_for_rising_edge.return_value = (
+        None if reached_timeout else 1621 * 10**9
+    )
     with unittest.mock.patch(
         "cc1101._gpio.GPIOLine.find", return_value=line_mock
     ) as find_line_mock, unittest.mock.patch.object(
@@ -66,7 +70,11 @@ def test__wait_for_packet(transceiver, gdo0_gpio_line_name, timeout, reached_tim
         transceiver, "_enable_receive_mode"
     ) as enable_receive_mode_mock, unittest.mock.patch.object(
         transceiver, "_command_strobe"
-    ) as command_strobe_mock:
+    ) as command_strobe_mock, unittest.mock.patch(
+        "time.monotonic_ns", return_value=1623 * 10**9
+    ), unittest.mock.patch(
+        "time.time_ns", return_value=1700000000 * 10**9
+    ):
         packet = transceiver._wait_for_packet(
             timeout=timeout,
             gdo0_gpio_line_name=gdo0_gpio_line_name,
@@ -82,5 +90,20 @@ def test__wait_for_packet(transceiver, gdo0_gpio_line_name, timeout, reached_tim
         get_received_packet_mock.assert_not_called()
     else:
         command_strobe_mock.assert_not_called()
-        get_received_packet_mock.assert_called_once_with()
+        get_received_packet_mock.assert_called_once_with(
+            monotonic_time_ns=1621 * 10**9, realtime_ns=(1700000000 - 2) * 10**9
+        )
         assert packet == "packet-dummy"
+
+
+def test__get_received_packet_timestamp(transceiver):
+    with unittest.mock.patch.object(
+        transceiver, "_read_status_register", return_value=3
+    ), unittest.mock.patch.object(
+        transceiver, "_read_burst", return_value=[0x21, 128, 42]
+    ):
+        received_packet = transceiver._get_received_packet(
+            monotonic_time_ns=21, realtime_ns=1700000000 * 10**9 + 42
+        )
+    assert received_packet.monotonic_time_ns == 21
+    assert received_packet.realtime_ns == 1700000000 * 10**9 + 42
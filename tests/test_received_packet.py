@@ -1,3 +1,5 @@
+import datetime
+
 import pytest
 
 import cc1101
@@ -34,3 +36,20 @@ def test___str__():
         link_quality_indicator=0,
     )
     assert str(packet) == "_ReceivedPacket(RSSI -100dBm, 0x001234)"
+
+
+def test_timestamp():
+    packet = cc1101._ReceivedPacket(
+        payload=b"\0",
+        rssi_index=0,
+        checksum_valid=True,
+        link_quality_indicator=0,
+        monotonic_time_ns=42,
+        realtime_ns=1700000000 * 10**9 + 500 * 10**6,
+    )
+    assert packet.monotonic_time_ns == 42
+    assert packet.timestamp == datetime.datetime(
+        2023, 11, 14, 22, 13, 20, 500000, tzinfo=datetime.timezone.utc
+    )
+    packet.realtime_ns = None
+    assert packet.timestamp is None
@@ -0,0 +1,159 @@
+# python-cc1101 - Python Library to Transmit RF Signals via CC1101 Transceivers
+#
+# Copyright (C) 2026 Fabian Peter Hammerle <fabian@hammerle.me>
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+import pytest
+
+import cc1101
+import cc1101.ringbuffer
+
+# pylint: disable=protected-access
+
+
+def _packet(payload: bytes, **kwargs) -> cc1101._ReceivedPacket:
+    return cc1101._ReceivedPacket(
+        payload=payload,
+        rssi_index=kwargs.get("rssi_index", 0x80),
+        checksum_valid=kwargs.get("checksum_valid", True),
+        link_quality_indicator=kwargs.get("link_quality_indicator", 0x12),
+        monotonic_time_ns=kwargs.get("monotonic_time_ns"),
+        realtime_ns=kwargs.get("realtime_ns"),
+    )
+
+
+def test_read(tmp_path):
+    path = tmp_path.joinpath("ring")
+    with cc1101.ringbuffer.RingBufferWriter(path, slot_count=4) as writer:
+        writer.write(_packet(b"before attaching"))
+        with cc1101.ringbuffer.RingBufferReader(
+            path
+        ) as reader, cc1101.ringbuffer.RingBufferReader(str(path)) as other_reader:
+            assert reader.read() is None
+            writer.write(
+                _packet(
+                    b"\x01\x02",
+                    rssi_index=0x7F,
+                    checksum_valid=False,
+                    link_quality_indicator=0x7F,
+                    monotonic_time_ns=21,
+                    realtime_ns=42,
+                )
+            )
+            writer.write(_packet(b"\xff" * 255))
+            packet = reader.read()
+            assert packet is not None
+            assert packet.payload == b"\x01\x02"
+            assert packet._rssi_index == 0x7F
+            assert not packet.checksum_valid
+            assert packet.link_quality_indicator == 0x7F
+            assert packet.monotonic_time_ns == 21
+            assert packet.realtime_ns == 42
+            packet = reader.read()
+            assert packet is not None
+            assert packet.payload == b"\xff" * 255
+            assert packet.checksum_valid
+            assert packet.monotonic_time_ns is None
+            assert packet.realtime_ns is None
+            assert reader.read() is None
+            assert [other_reader.read().payload for _ in range(2)] == [
+                b"\x01\x02",
+                b"\xff" * 255,
+            ]
+            assert reader.dropped_packets == other_reader.dropped_packets == 0
+
+
+def test_overrun(tmp_path):
+    path = tmp_path.joinpath("ring")
+    with cc1101.ringbuffer.RingBufferWriter(
+        path, slot_count=2
+    ) as writer, cc1101.ringbuffer.RingBufferReader(path) as reader:
+        for index in range(5):
+            writer.write(_packet(bytes((index,))))
+        assert reader.read().payload == b"\x03"
+        assert reader.dropped_packets == 3
+        assert reader.read().payload == b"\x04"
+        assert reader.read() is None
+
+
+def test_read_view(tmp_path):
+    path = tmp_path.joinpath("ring")
+    with cc1101.ringbuffer.RingBufferWriter(
+        path, slot_count=2
+    ) as writer, cc1101.ringbuffer.RingBufferReader(path) as reader:
+        writer.write(_packet(b"first"))
+        record = reader.read_view()
+        assert record is not None
+        assert record.sequence == 1
+        assert record.rssi_index == 0x80
+        with record.payload:
+            assert record.payload == b"first"
+            assert record.is_valid()
+            writer.write(_packet(b"second"))
+            assert record.is_valid()
+            writer.write(_packet(b"third"))
+            assert not record.is_valid()  # overwritten
+        with pytest.raises(BufferError):
+            reader.__exit__(None, None, None)
+        del record
+        assert reader.read().payload == b"second"
+
+
+def test_read_overwritten_while_copying(tmp_path):
+    path = tmp_path.joinpath("ring")
+    with cc1101.ringbuffer.RingBufferWriter(
+        path, slot_count=1
+    ) as writer, cc1101.ringbuffer.RingBufferReader(path) as reader:
+        writer.write(_packet(b"first"))
+        read_view = reader.read_view
+
+        def _read_view():
+            record = read_view()
+            if record is not None and record.sequence == 1:
+                writer.write(_packet(b"second"))
+            return record
+
+        reader.read_view = _read_view  # type: ignore
+        assert reader.read().payload == b"second"
+        assert reader.dropped_packets == 1
+
+
+def test_read_slot_being_written(tmp_path):
+    path = tmp_path.joinpath("ring")
+    with cc1101.ringbuffer.RingBufferWriter(
+        path, slot_count=2
+    ) as writer, cc1101.ringbuffer.RingBufferReader(path) as reader:
+        writer.write(_packet(b"first"))
+        assert writer._mmap is not None
+        offset = cc1101.ringbuffer._slot_offset(1, 2)
+        # writer wrote header of slot 3 (invalidating slot 1) but not sequence yet
+        writer._mmap[offset : offset + 8] = bytes(8)
+        writer._sequence = 2
+        writer.write(_packet(b"third"))
+        assert reader.read().payload == b"third"
+        assert reader.dropped_packets == 1
+
+
+def test_invalid(tmp_path):
+    path = tmp_path.joinpath("ring")
+    with pytest.raises(ValueError, match=r"^expected at least one slot, got 0$"):
+        cc1101.ringbuffer.RingBufferWriter(path, slot_count=0)
+    with cc1101.ringbuffer.RingBufferWriter(path) as writer:
+        with pytest.raises(ValueError, match=r"\bcapacity of 256 bytes$"):
+            writer.write(_packet(bytes(257)))
+    path.write_bytes(bytes(64))
+    with pytest.raises(ValueError, match=r"\bis not a ring buffer$"):
+        with cc1101.ringbuffer.RingBufferReader(path):
+            pass  # pragma: no cover
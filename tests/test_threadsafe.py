@@ -0,0 +1,172 @@
+# python-cc1101 - Python Library to Transmit RF Signals via CC1101 Transceivers
+#
+# Copyright (C) 2026 Fabian Peter Hammerle <fabian@hammerle.me>
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+import datetime
+import os
+import threading
+import time
+import unittest.mock
+
+import pytest
+
+import cc1101
+import cc1101.threadsafe
+from cc1101.addresses import StatusRegisterAddress, StrobeAddress
+
+# pylint: disable=protected-access
+
+_TIMEOUT_SECONDS = 4
+
+
+def test_thread_safe_proxy(transceiver_mock):
+    transceiver_mock._spi_bus = 1
+    transceiver_mock.__str__.return_value = "dummy"
+    proxy = cc1101.threadsafe.ThreadSafeCC1101(transceiver_mock)
+    assert proxy.transceiver is transceiver_mock
+    assert proxy._spi_bus == 1
+    lock_acquirable_during_call = []
+
+    def _set_base_frequency_hertz(freq):
+        # try to acquire from a different thread
+        thread = threading.Thread(
+            target=lambda: lock_acquirable_during_call.append(
+                proxy.lock.acquire(  # pylint: disable=consider-using-with
+                    blocking=False
+                )
+            )
+        )
+        thread.start()
+        thread.join()
+        return freq
+
+    transceiver_mock.set_base_frequency_hertz.side_effect = _set_base_frequency_hertz
+    assert proxy.set_base_frequency_hertz(433.92e6) == 433.92e6
+    assert lock_acquirable_during_call == [False]
+    transceiver_mock.set_base_frequency_hertz.assert_called_once_with(433.92e6)
+    transceiver_mock.__exit__.return_value = False
+    with proxy as entered:
+        assert entered is proxy
+        transceiver_mock.__enter__.assert_called_once_with()
+        assert str(proxy) == "dummy"
+    transceiver_mock.__exit__.assert_called_once_with(None, None, None)
+
+
+def _wait_for_receive_mode(transceiver_mock, call_count: int) -> None:
+    deadline = time.monotonic() + _TIMEOUT_SECONDS
+    while transceiver_mock._enable_receive_mode.call_count < call_count:
+        assert time.monotonic() < deadline
+        time.sleep(0.001)
+
+
+def _transmitted(transceiver_mock) -> list[bytes]:
+    return [c.args[0] for c in transceiver_mock.transmit.call_args_list]
+
+
+def test_scheduler_transmit_priority(transceiver_mock, gdo0_line_mock):
+    find_mock, line_mock, _ = gdo0_line_mock
+    transceiver_mock._transmission_completed.side_effect = [False, True, True, True]
+    scheduler = cc1101.threadsafe.HalfDuplexScheduler(
+        transceiver_mock,
+        gdo0_gpio_line_name=b"GPIO25",
+        poll_interval=datetime.timedelta(microseconds=100),
+    )
+    assert isinstance(scheduler.transceiver, cc1101.threadsafe.ThreadSafeCC1101)
+    futures = [
+        scheduler.submit(b"normal"),
+        scheduler.submit(b"low", priority=1),
+        scheduler.submit(b"urgent", priority=-1),
+        scheduler.submit(b"normal2"),
+    ]
+    futures[3].cancel()
+    with scheduler:
+        for future in futures[:3]:
+            assert future.result(timeout=_TIMEOUT_SECONDS) is None
+        assert _transmitted(transceiver_mock) == [b"urgent", b"normal", b"low"]
+        _wait_for_receive_mode(transceiver_mock, call_count=1)
+    find_mock.assert_called_once_with(name=b"GPIO25")
+    line_mock.request_rising_edge_events.assert_called_once_with(
+        consumer=b"CC1101:GDO0"
+    )
+    line_mock.release.assert_called_once_with()
+    assert transceiver_mock._command_strobe.call_args_list[-1] == unittest.mock.call(
+        StrobeAddress.SIDLE
+    )
+    assert unittest.mock.call(StrobeAddress.SFRX) in (
+        transceiver_mock._command_strobe.call_args_list
+    )
+
+
+def test_scheduler_transmit_error(transceiver_mock, gdo0_line_mock):
+    # pylint: disable=unused-argument; gdo0_line_mock
+    transceiver_mock._read_status_register.return_value = 0  # PKTSTATUS
+    transceiver_mock.transmit.side_effect = ValueError("payload too long")
+    with cc1101.threadsafe.HalfDuplexScheduler(transceiver_mock) as scheduler:
+        future = scheduler.submit(b"message")
+        with pytest.raises(ValueError, match=r"^payload too long$"):
+            future.result(timeout=_TIMEOUT_SECONDS)
+        transceiver_mock.transmit.side_effect = None
+        transceiver_mock._transmission_completed.return_value = True
+        assert scheduler.submit(b"message").result(timeout=_TIMEOUT_SECONDS) is None
+
+
+def test_scheduler_receive(transceiver_mock, gdo0_line_mock):
+    _, _, write_fd = gdo0_line_mock
+    transceiver_mock._get_received_packet.side_effect = [None, "packet"]
+    with cc1101.threadsafe.HalfDuplexScheduler(transceiver_mock) as scheduler:
+        _wait_for_receive_mode(transceiver_mock, call_count=1)
+        os.write(write_fd, (21).to_bytes(8, "big"))
+        _wait_for_receive_mode(transceiver_mock, call_count=2)
+        os.write(write_fd, (42).to_bytes(8, "big") + (43).to_bytes(8, "big"))
+        assert scheduler.received_packets.get(timeout=_TIMEOUT_SECONDS) == "packet"
+    assert scheduler.received_packets.empty()
+    assert [
+        c.kwargs["monotonic_time_ns"]
+        for c in transceiver_mock._get_received_packet.call_args_list
+    ] == [21, 42]
+    assert transceiver_mock._enable_receive_mode.call_count >= 2
+
+
+def test_scheduler_defer_transmission(transceiver_mock, gdo0_line_mock):
+    # pylint: disable=unused-argument; gdo0_line_mock
+    sfd = [True]
+    transceiver_mock._read_status_register.side_effect = lambda r: (
+        0b00001000 if sfd[0] else 0
+    )
+    transceiver_mock._transmission_completed.return_value = True
+    with cc1101.threadsafe.HalfDuplexScheduler(transceiver_mock) as scheduler:
+        _wait_for_receive_mode(transceiver_mock, call_count=1)
+        future = scheduler.submit(b"message")
+        time.sleep(0.02)
+        assert not future.done()
+        transceiver_mock.transmit.assert_not_called()
+        transceiver_mock._read_status_register.assert_called_with(
+            StatusRegisterAddress.PKTSTATUS
+        )
+        sfd[0] = False
+        assert future.result(timeout=_TIMEOUT_SECONDS) is None
+    transceiver_mock.transmit.assert_called_once_with(b"message")
+
+
+def test_scheduler_stop_pending(transceiver_mock, gdo0_line_mock):
+    # pylint: disable=unused-argument; gdo0_line_mock
+    transceiver_mock._read_status_register.return_value = 0b00001000  # SFD
+    with cc1101.threadsafe.HalfDuplexScheduler(transceiver_mock) as scheduler:
+        _wait_for_receive_mode(transceiver_mock, call_count=1)
+        future = scheduler.submit(b"message")
+    with pytest.raises(RuntimeError, match=r"^scheduler stopped$"):
+        future.result(timeout=0)
+    transceiver_mock.transmit.assert_not_called()
@@ -149,3 +149,45 @@ def test_asynchronous_transmission(transceiver: cc1101.CC1101) -> None:
         set_mode_mock.assert_called_once_with(cc1101.options._TransceiveMode.FIFO)
         command_mock.assert_called_once_with(cc1101.addresses.StrobeAddress.SIDLE)
         transceiver._spi.xfer.assert_not_called()
+
+
+@pytest.mark.parametrize(
+    ("marcstate", "txbytes", "completed"),
+    (
+        (cc1101.MainRadioControlStateMachineState.IDLE, 0, True),
+        (cc1101.MainRadioControlStateMachineState.IDLE, 0b10000000, True),
+        (cc1101.MainRadioControlStateMachineState.IDLE, 4, False),
+        (cc1101.MainRadioControlStateMachineState.FS_LOCK, 4, False),
+        (cc1101.MainRadioControlStateMachineState.TX, 0, False),
+        (cc1101.MainRadioControlStateMachineState.TX_END, 0, False),
+    ),
+)
+def test__transmission_completed(
+    transceiver: cc1101.CC1101,
+    marcstate: cc1101.MainRadioControlStateMachineState,
+    txbytes: int,
+    completed: bool,
+) -> None:
+    with unittest.mock.patch.object(
+        transceiver,
+        "get_main_radio_control_state_machine_state",
+        return_value=marcstate,
+    ), unittest.mock.patch.object(
+        transceiver, "_read_status_register", return_value=txbytes
+    ) as read_status_register_mock:
+        assert transceiver._transmission_completed() is completed
+    if marcstate == cc1101.MainRadioControlStateMachineState.IDLE:
+        read_status_register_mock.assert_called_once_with(
+            cc1101.addresses.StatusRegisterAddress.TXBYTES
+        )
+
+
+def test__transmission_completed_underflow(transceiver: cc1101.CC1101) -> None:
+    transceiver._spi.xfer.return_value = [15]
+    with unittest.mock.patch.object(
+        transceiver,
+        "get_main_radio_control_state_machine_state",
+        return_value=cc1101.MainRadioControlStateMachineState.TXFIFO_UNDERFLOW,
+    ), pytest.raises(RuntimeError, match=r"^TX FIFO underflow$"):
+        transceiver._transmission_completed()
+    transceiver._spi.xfer.assert_called_once_with([0x3B])  # SFTX